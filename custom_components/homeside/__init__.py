@@ -5,7 +5,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from ._vars import async_get_variables
 from .client import HomesideClient
+from .coordinator import HomesideDataUpdateCoordinator
 from .const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, DOMAIN, PLATFORMS
 
 
@@ -31,7 +33,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
         "device_id": entry.entry_id,
+        # One coordinator polls the addresses of every platform; each platform
+        # registers its addresses and intervals during setup
+        "coordinator": HomesideDataUpdateCoordinator(
+            hass, client, name="homeside_variables"
+        ),
     }
+    # Parse variables.json once up front; the platforms reuse the cached copy
+    await async_get_variables(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     # Register update listener for options changes
@@ -0,0 +1,197 @@
+"""Shared access to variables.json for the HomeSide platforms."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import logging
+from pathlib import Path
+import re
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+try:
+    # orjson ships with Home Assistant and decodes bytes without a str copy
+    from orjson import JSONDecodeError, loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import JSONDecodeError, loads as _json_loads
+
+from .const import (
+    DOMAIN,
+    FAST_UPDATE_PATTERNS,
+    SLOW_UPDATE_PATTERNS,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_NORMAL,
+    UPDATE_INTERVAL_SLOW,
+    UPDATE_INTERVAL_VERY_SLOW,
+    VERY_SLOW_UPDATE_PATTERNS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+VARIABLES_FILE = Path(__file__).resolve().parent / "variables.json"
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str]:
+    """Compile substring patterns into a single alternation (one C-level scan)."""
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+# Update-group matchers, applied to lowercased variable names
+VERY_SLOW_UPDATE_RE = _compile_patterns(VERY_SLOW_UPDATE_PATTERNS)
+SLOW_UPDATE_RE = _compile_patterns(SLOW_UPDATE_PATTERNS)
+FAST_UPDATE_RE = _compile_patterns(FAST_UPDATE_PATTERNS)
+
+# (group, matcher, interval) in priority order; first match wins
+_UPDATE_GROUPS: tuple[tuple[str, re.Pattern[str], int], ...] = (
+    ("very_slow", VERY_SLOW_UPDATE_RE, UPDATE_INTERVAL_VERY_SLOW),
+    ("slow", SLOW_UPDATE_RE, UPDATE_INTERVAL_SLOW),
+    ("fast", FAST_UPDATE_RE, UPDATE_INTERVAL_FAST),
+)
+
+
+def classify_update_group(name_lower: str) -> tuple[str, int]:
+    """Return (group name, interval in seconds) for a lowercased variable name."""
+    for group, matcher, interval in _UPDATE_GROUPS:
+        if matcher.search(name_lower):
+            return group, interval
+    return "normal", UPDATE_INTERVAL_NORMAL
+
+# Characters in variable keys/addresses that are replaced in entity ids
+_UID_TRANS = str.maketrans({":": "_", "/": "_"})
+
+
+@lru_cache(maxsize=None)
+def uid_slug(key: str) -> str:
+    """Return key with ':' and '/' replaced by '_', for unique_ids and names."""
+    return key.translate(_UID_TRANS)
+
+
+_VARS_KEY = "_vars"
+_VARS_MTIME_KEY = "_vars_mtime"
+_CONFIGS_KEY = "_var_configs"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class VariableConfig:
+    key: str  # Descriptive key from variables.json
+    name: str
+    name_lower: str  # Pre-lowercased name for pattern matching
+    enabled: bool
+    type: str
+    note: str | None = None
+    access: str | None = None
+    role_access: str | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    address: list[str]  # Address(es) for this entity
+    format: str | None = None
+    decimals: int | None = None
+    options: list[str] | None = None
+    values: list[int] | None = None
+    none_value: Any = 0  # Fallback value for "Dataconversion error" (47)
+
+
+def _load_variable_configs(raw: dict[str, Any]) -> list[VariableConfig]:
+    """Build variable configs from the parsed variables.json."""
+    default_role_access = raw.get("role_access_default") or "Guest"
+    none_value = raw.get("none_value_dafault", 0)
+
+    configs: list[VariableConfig] = []
+    for key, info in (raw.get("mapping") or {}).items():
+        if not key or not isinstance(key, str):
+            continue
+        if not isinstance(info, dict):
+            _LOGGER.debug("Skipping %s: config must be an object", key)
+            continue
+        
+        address = info.get("address")
+        if not address or not isinstance(address, list):
+            _LOGGER.debug("Skipping %s: address is required and must be a list", key)
+            continue
+        
+        # Values are normally already the right type; only coerce when not
+        name = info.get("name") or key
+        if type(name) is not str:
+            name = str(name)
+        enabled = info.get("enabled", False)
+        if type(enabled) is not bool:
+            enabled = bool(enabled)
+        vtype = info.get("type") or "sensor"
+        if type(vtype) is not str:
+            vtype = str(vtype)
+        
+        configs.append(
+            VariableConfig(
+                key=key,
+                name=name,
+                name_lower=name.lower(),
+                enabled=enabled,
+                type=vtype,
+                note=info.get("note"),
+                access=info.get("access"),
+                role_access=info.get("role_access") or default_role_access,
+                unit=info.get("unit"),
+                device_class=info.get("device_class"),
+                address=address,
+                format=info.get("format"),
+                decimals=info.get("decimals"),
+                options=info.get("options"),
+                values=info.get("values"),
+                none_value=none_value,
+            )
+        )
+    return configs
+
+
+def _read_variables(cached_mtime: int | None) -> tuple[int | None, dict[str, Any] | None]:
+    """Stat variables.json and parse it only if it changed since cached_mtime.
+
+    Runs in the executor. Returns (mtime, raw) where raw is None when the
+    cached copy is still current.
+    """
+    try:
+        mtime = VARIABLES_FILE.stat().st_mtime_ns
+    except OSError:
+        return None, {}
+
+    if mtime == cached_mtime:
+        return mtime, None
+
+    try:
+        raw = _json_loads(VARIABLES_FILE.read_bytes())
+    except (OSError, JSONDecodeError) as exc:
+        _LOGGER.warning("Failed to read variables mapping: %s", exc)
+        return None, {}
+
+    if not isinstance(raw, dict):
+        _LOGGER.warning("Failed to read variables mapping: root must be an object")
+        return None, {}
+    return mtime, raw
+
+
+async def async_get_variables(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the parsed variables.json, cached in hass.data by file mtime."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    mtime, raw = await hass.async_add_executor_job(
+        _read_variables, domain_data.get(_VARS_MTIME_KEY)
+    )
+    if raw is None:
+        return domain_data[_VARS_KEY]
+
+    domain_data[_VARS_KEY] = raw
+    domain_data[_VARS_MTIME_KEY] = mtime
+    return raw
+
+
+async def async_get_variable_configs(hass: HomeAssistant) -> list[VariableConfig]:
+    """Return parsed variable configs, rebuilt only when variables.json changes."""
+    raw = await async_get_variables(hass)
+    domain_data = hass.data[DOMAIN]
+    cached = domain_data.get(_CONFIGS_KEY)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+
+    configs = _load_variable_configs(raw)
+    domain_data[_CONFIGS_KEY] = (raw, configs)
+    return configs
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
 import logging
-from pathlib import Path
+from operator import itemgetter
+import re
 from typing import Any
 from datetime import timedelta
 
@@ -12,37 +11,34 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
+from ._vars import (
+    VariableConfig,
+    async_get_variable_configs,
+    classify_update_group,
+    uid_slug,
+)
 from .client import HomesideClient
+from .coordinator import HomesideDataUpdateCoordinator
 from .const import (
     DOMAIN,
-    FAST_UPDATE_PATTERNS,
-    NORMAL_UPDATE_PATTERNS,
-    SLOW_UPDATE_PATTERNS,
-    VERY_SLOW_UPDATE_PATTERNS,
-    UPDATE_INTERVAL_FAST,
     UPDATE_INTERVAL_NORMAL,
-    UPDATE_INTERVAL_SLOW,
-    UPDATE_INTERVAL_VERY_SLOW,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-_VARIABLES_FILE = Path(__file__).resolve().parent / "variables.json"
+# Binary sensor names (lowercased) that mark a configuration selection
+_CONFIG_SENSOR_RE = re.compile("val|status")
 
+# Shared stand-in for coordinator data before the first successful refresh
+_EMPTY: dict[str, dict[str, Any]] = {"values": {}, "errors": {}}
 
-@dataclass(frozen=True, kw_only=True)
-class VariableConfig:
-    key: str  # Descriptive key from variables.json
-    name: str
-    enabled: bool
-    type: str
-    note: str | None = None
-    access: str | None = None
-    role_access: str | None = None
-    address: list[str]  # Address(es) for this entity
-    format: str | None = None
+# Lowercased strings a combined value counts as "on"
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "on", "yes"})
 
 
 async def async_setup_entry(
@@ -53,91 +49,46 @@ async def async_setup_entry(
     client: HomesideClient = hass.data[DOMAIN][entry.entry_id]["client"]
     device_id = hass.data[DOMAIN][entry.entry_id]["device_id"]
 
-    variable_configs = _load_variable_configs()
+    variable_configs = await async_get_variable_configs(hass)
     # Session-level filtering
     from .const import ROLE_HIERARCHY
     session_level = getattr(client, '_session_level', None)
     allowed_roles = set()
     if session_level is not None:
         allowed_roles = set(ROLE_HIERARCHY[: session_level + 1])
-    binary_configs = [
-        cfg for cfg in variable_configs
-        if cfg.enabled and cfg.type == "binary_sensor" and (
-            not cfg.role_access or cfg.role_access in allowed_roles
-        )
-    ]
-    if not binary_configs:
+    # Filter and separate multi-variable combined sensors from
+    # single-variable sensors in one pass
+    combined_sensors: list[VariableConfig] = []
+    regular_sensors: list[VariableConfig] = []
+    for cfg in variable_configs:
+        if not cfg.enabled or cfg.type != "binary_sensor":
+            continue
+        if cfg.role_access and cfg.role_access not in allowed_roles:
+            continue
+        count = len(cfg.address)
+        if count > 1:
+            combined_sensors.append(cfg)
+        elif count == 1:
+            regular_sensors.append(cfg)
+    if not combined_sensors and not regular_sensors:
         return
 
-    # Separate multi-variable combined sensors from single-variable sensors
-    combined_sensors = [cfg for cfg in binary_configs if len(cfg.address) > 1]
-    regular_sensors = [cfg for cfg in binary_configs if len(cfg.address) == 1]
-
-    # Group binary sensors by update interval
-    fast_sensors = []
-    normal_sensors = []
-    slow_sensors = []
-    very_slow_sensors = []
-    
-    for cfg in regular_sensors:
-        name_lower = cfg.name.lower()
-        if any(pattern in name_lower for pattern in VERY_SLOW_UPDATE_PATTERNS):
-            very_slow_sensors.append(cfg)
-        elif any(pattern in name_lower for pattern in SLOW_UPDATE_PATTERNS):
-            slow_sensors.append(cfg)
-        elif any(pattern in name_lower for pattern in FAST_UPDATE_PATTERNS):
-            fast_sensors.append(cfg)
-        else:
-            normal_sensors.append(cfg)
-    
     entities = []
     
-    # Create coordinators for each update group
-    sensor_groups = [
-        (fast_sensors, UPDATE_INTERVAL_FAST, "fast"),
-        (normal_sensors, UPDATE_INTERVAL_NORMAL, "normal"),
-        (slow_sensors, UPDATE_INTERVAL_SLOW, "slow"),
-        (very_slow_sensors, UPDATE_INTERVAL_VERY_SLOW, "very_slow"),
-    ]
-    
-    for group_configs, interval, group_name in sensor_groups:
-        if not group_configs:
-            continue
-            
-        variables = [cfg.address[0] for cfg in group_configs]
-        name_by_address = {cfg.address[0]: cfg.name for cfg in group_configs}
-        note_by_address = {cfg.address[0]: cfg.note for cfg in group_configs}
-        access_by_address = {cfg.address[0]: cfg.access for cfg in group_configs}
-        role_by_address = {cfg.address[0]: cfg.role_access for cfg in group_configs}
-
-        async def _update_variables(vars=variables, names=name_by_address, notes=note_by_address, access=access_by_address, roles=role_by_address) -> dict[str, Any]:
-            await client.ensure_connected()
-            values, errors = await client.read_points_with_errors(vars)
-            mapped_values = {names[address]: values.get(address) for address in vars}
-            mapped_errors = {names[address]: errors.get(address) for address in vars}
-            mapped_notes = {names[address]: notes.get(address) for address in vars}
-            mapped_access = {names[address]: access.get(address) for address in vars}
-            mapped_roles = {names[address]: roles.get(address) for address in vars}
-            return {
-                "values": mapped_values,
-                "errors": mapped_errors,
-                "notes": mapped_notes,
-                "access": mapped_access,
-                "role_access": mapped_roles,
-            }
-
-        variables_coordinator = DataUpdateCoordinator(
-            hass,
-            logger=_LOGGER,
-            name=f"homeside_binary_variables_{group_name}",
-            update_method=_update_variables,
-            update_interval=timedelta(seconds=interval),
+    # Regular binary sensors are polled by the entry's shared coordinator,
+    # each at its update group's interval
+    if regular_sensors:
+        variables_coordinator: HomesideDataUpdateCoordinator = (
+            hass.data[DOMAIN][entry.entry_id]["coordinator"]
         )
+        for cfg in regular_sensors:
+            _group, interval = classify_update_group(cfg.name_lower)
+            variables_coordinator.add_address(cfg.address[0], interval)
 
-        await variables_coordinator.async_refresh()
+        await variables_coordinator.async_refresh_new_addresses()
         entities.extend(
-            HomesideVariableBinarySensor(variables_coordinator, cfg.name, device_id)
-            for cfg in group_configs
+            HomesideVariableBinarySensor(variables_coordinator, cfg, device_id)
+            for cfg in regular_sensors
         )
     
     # Add combined binary sensors
@@ -146,34 +97,42 @@ async def async_setup_entry(
             if not cfg.address:
                 continue
             
-            variables = cfg.address
-            
-            async def _update_combined(vars=variables, fmt=cfg.format, cfg_name=cfg.name) -> dict[str, Any]:
-                await client.ensure_connected()
+            async def _update_combined(
+                vars=tuple(cfg.address),
+                getter=itemgetter(*cfg.address),
+                fmt=cfg.format,
+                cfg_name=cfg.name,
+            ) -> dict[str, Any]:
                 values, errors = await client.read_points_with_errors(vars)
-                
-                # Apply format template
-                if fmt and all(addr in values for addr in vars):
-                    try:
-                        formatted_value = fmt.format(*[values[addr] for addr in vars])
-                    except (KeyError, IndexError, ValueError) as e:
-                        _LOGGER.warning("Failed to format combined binary sensor %s: %s", cfg_name, e)
-                        formatted_value = None
+                formatted_value = None
+                try:
+                    args = getter(values)
+                except KeyError:
+                    # Some source was not returned at all
+                    get = values.get
+                    sources = {addr: get(addr) for addr in vars}
                 else:
-                    formatted_value = None
+                    sources = dict(zip(vars, args))
+                    # Apply format template (only when every source has a value)
+                    if fmt and None not in args:
+                        try:
+                            formatted_value = fmt.format(*args)
+                        except (KeyError, IndexError, ValueError) as e:
+                            _LOGGER.warning("Failed to format combined binary sensor %s: %s", cfg_name, e)
                 
                 return {
                     "value": formatted_value,
-                    "sources": {addr: values.get(addr) for addr in vars},
-                    "errors": {addr: errors.get(addr) for addr in vars},
+                    "sources": sources,
+                    "errors": {addr: errors[addr] for addr in vars if errors.get(addr)},
                 }
             
             combined_coordinator = DataUpdateCoordinator(
                 hass,
                 logger=_LOGGER,
-                name=f"homeside_combined_binary_{cfg.address[0].replace(':', '_')}",
+                name=f"homeside_combined_binary_{uid_slug(cfg.address[0])}",
                 update_method=_update_combined,
                 update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
+                always_update=False,
             )
             
             await combined_coordinator.async_refresh()
@@ -184,94 +143,69 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class HomesideVariableBinarySensor(BinarySensorEntity):
+class HomesideVariableBinarySensor(CoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
-        name: str,
+        coordinator: HomesideDataUpdateCoordinator,
+        config: VariableConfig,
         device_id: str,
     ) -> None:
-        self._coordinator = coordinator
-        self._name = name
+        super().__init__(coordinator)
+        self._config = config
+        self._name = config.name
+        self._address = config.address[0]
         self._device_id = device_id
-        self._attr_unique_id = f"homeside_var_{name}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
+        self._attr_unique_id = f"homeside_var_{config.name}"
         
         # Set entity category based on binary sensor type
-        name_lower = name.lower()
-        if any(word in name_lower for word in ['val', 'status']):
+        if _CONFIG_SENSOR_RE.search(config.name_lower):
             # Configuration switches (selection of sensors/modes)
             self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def name(self) -> str | None:
-        return self._name
-
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
         }
 
     @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
+    def name(self) -> str | None:
+        return self._name
 
     @property
     def is_on(self) -> bool | None:
-        data = self._coordinator.data or {}
-        values = data.get("values", {})
-        errors = data.get("errors", {})
-        value = values.get(self._name)
-        error = errors.get(self._name)
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
-        if error and error.get("code") == 47 and value is None:
-            value = none_value_default
+        data = self.coordinator.data or _EMPTY
+        value = data["values"].get(self._address)
         if value is None:
-            return None
+            error = data["errors"].get(self._address)
+            if error and error.get("code") == 47:
+                value = self._config.none_value
+            if value is None:
+                return None
         if isinstance(value, bool):
             return value
         return bool(value)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        data = self._coordinator.data or {}
-        errors = data.get("errors", {})
-        info = errors.get(self._name)
-        note = (data.get("notes", {}) or {}).get(self._name)
-        access = (data.get("access", {}) or {}).get(self._name)
-        role_access = (data.get("role_access", {}) or {}).get(self._name)
-        extra: dict[str, Any] = {}
-        if note:
-            extra["note"] = note
-        if access:
-            extra["access"] = access
-        if role_access:
-            extra["role_access"] = role_access
+        info = (self.coordinator.data or _EMPTY)["errors"].get(self._address)
         if not info:
-            return extra or None
-        extra.update(
-            {
-                "error_code": info.get("code"),
-                "error_text": info.get("text"),
-            }
-        )
-        return extra
-
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
+            return self._static_attrs or None
+        return {
+            **self._static_attrs,
+            "error_code": info.get("code"),
+            "error_text": info.get("text"),
+        }
 
 
 class HomesideCombinedBinarySensor(BinarySensorEntity):
@@ -288,19 +222,28 @@ class HomesideCombinedBinarySensor(BinarySensorEntity):
         self._config = config
         self._name = config.name
         self._device_id = device_id
-        self._attr_unique_id = f"homeside_combined_binary_{config.key.replace(':', '_').replace('/', '_')}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
+        self._attr_unique_id = f"homeside_combined_binary_{uid_slug(config.key)}"
+
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("address", config.address),
+                ("format", config.format),
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
+        }
 
     @property
     def name(self) -> str | None:
         return self._name
 
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
-
     @property
     def available(self) -> bool:
         return self._coordinator.last_update_success
@@ -310,107 +253,32 @@ class HomesideCombinedBinarySensor(BinarySensorEntity):
         data = self._coordinator.data or {}
         value = data.get("value")
         errors = data.get("errors", {})
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
         # If any error for a source is code 47 and value is None, use fallback
-        if any((err and err.get("code") == 47 and value is None) for err in errors.values()):
-            value = none_value_default
+        if value is None and any(err.get("code") == 47 for err in errors.values()):
+            value = self._config.none_value
         if value is None:
             return None
-        if isinstance(value, bool):
+        if value is True or value is False:
             return value
         # Try to convert to bool
         if isinstance(value, str):
-            return value.lower() in ('true', '1', 'on', 'yes')
+            return value.lower() in _TRUTHY
         return bool(value)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         data = self._coordinator.data or {}
-        sources = data.get("sources", {})
-        errors = data.get("errors", {})
-        
-        extra: dict[str, Any] = {}
-        
+        sources = data.get("sources")
+        errors = data.get("errors")
+        if not sources and not errors:
+            return self._static_attrs or None
+
+        extra: dict[str, Any] = {**self._static_attrs}
         if sources:
             extra["sources"] = sources
-        
-        if self._config.address:
-            extra["address"] = self._config.address
-        
-        if self._config.format:
-            extra["format"] = self._config.format
-        
-        if self._config.note:
-            extra["note"] = self._config.note
-        
-        if self._config.access:
-            extra["access"] = self._config.access
-        if self._config.role_access:
-            extra["role_access"] = self._config.role_access
-        
-        if any(errors.values()):
-            extra["errors"] = {k: v for k, v in errors.items() if v}
-        
-        return extra or None
+        if errors:
+            extra["errors"] = errors
+        return extra
 
     async def async_update(self) -> None:
         await self._coordinator.async_request_refresh()
-
-
-def _load_variable_configs() -> list[VariableConfig]:
-    if not _VARIABLES_FILE.exists():
-        return []
-
-    try:
-        raw = json.loads(_VARIABLES_FILE.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
-        _LOGGER.warning("Failed to read variables mapping: %s", exc)
-        return []
-
-    default_role_access = raw.get("role_access_default") or "Guest"
-
-    configs: list[VariableConfig] = []
-    for key, info in (raw.get("mapping") or {}).items():
-        if not key or not isinstance(key, str):
-            continue
-        if not isinstance(info, dict):
-            _LOGGER.debug("Skipping %s: config must be an object", key)
-            continue
-        
-        address = info.get("address")
-        if not address or not isinstance(address, list):
-            _LOGGER.debug("Skipping %s: address is required and must be a list", key)
-            continue
-        
-        name = str(info.get("name") or key)
-        enabled = bool(info.get("enabled", False))
-        vtype = str(info.get("type") or "sensor")
-        note = info.get("note")
-        access = info.get("access")
-        role_access = info.get("role_access") or default_role_access
-        format_template = info.get("format")
-        
-        configs.append(
-            VariableConfig(
-                key=key,
-                name=name,
-                enabled=enabled,
-                type=vtype,
-                note=note,
-                access=access,
-                role_access=role_access,
-                address=address,
-                format=format_template,
-            )
-        )
-    return configs
@@ -2,23 +2,95 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
+from html.parser import HTMLParser
+from itertools import zip_longest
 import os
-import time
+import re
+import struct
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
-from Crypto.Cipher import AES
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, WSMsgType
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherContext, algorithms, modes
 
 try:
     from .const import WS_PATH, ERROR_CODES
 except ImportError:  # pragma: no cover - for script usage
     from const import WS_PATH, ERROR_CODES
 
+# Messages are serialized compactly: they are encrypted block by block, so
+# every byte of whitespace costs work on both ends
+try:
+    # orjson ships with Home Assistant and is compact by default
+    from orjson import JSONDecodeError, dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(payload: Any) -> str:
+        return _orjson_dumps(payload).decode()
+except ImportError:  # pragma: no cover - for script usage
+    from functools import partial
+    from json import JSONDecodeError, dumps as _stdlib_dumps, loads as _json_loads
+
+    # Same bytes as orjson: compact and raw UTF-8 rather than \u escapes
+    _json_dumps = partial(_stdlib_dumps, separators=(",", ":"), ensure_ascii=False)
+
 _LOGGER = logging.getLogger(__name__)
 
+_PING_MESSAGE = _json_dumps({"method": "ping"})
+
+# Substrings a raw message must contain to be worth parsing (see _receive_json)
+_UPDATE_MARKER = '"update"'
+_IDENTITY_MARKER = '"identity"'
+
+# 32-bit word layouts used by the auth handshake
+_U32_BE = struct.Struct(">I")
+_U32_LE = struct.Struct("<I")
+_DIGEST_WORDS = struct.Struct(">8I")
+_BLOCK_WORDS = struct.Struct(">4I")
+# The first two words of the encrypted auth block, read byte-swapped
+_AUTH_REPLY_WORDS = struct.Struct("<2I")
+
+# Patterns for the controller's /debug pages
+_DIGITS_RE = re.compile(r'(\d+)')
+_EXOLINE_SESSIONS_RE = re.compile(r'EXOline TCP sessions[^<]*?(\d+)/(\d+)')
+_REVERSE_IP_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)\s+\(reverse\)')
+_MODBUS_SESSIONS_RE = re.compile(r'Modbus TCP sessions[^<]*?(\d+)/(\d+)')
+_BACNET_VERSION_RE = re.compile(r'version[^<]*?(\d+\.\d+\.\d+\.\d+)')
+_BACNET_DEVICE_ID_RE = re.compile(r'device id[^<]*?(\d+)')
+
+
+class _DebugParser(HTMLParser):
+    """Collect first/last cell text of each table row on the /debug pages."""
+
+    def __init__(self):
+        super().__init__()
+        self.data = {}
+        self.current_key = None
+        self.in_td = False
+        self.td_count = 0
+        self.td_data = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "td":
+            self.in_td = True
+
+    def handle_endtag(self, tag):
+        if tag == "td":
+            self.in_td = False
+            self.td_count += 1
+        elif tag == "tr":
+            if len(self.td_data) >= 2:
+                key = self.td_data[0].strip()
+                value = self.td_data[-1].strip()
+                if key and value:
+                    self.data[key] = value
+            self.td_data = []
+            self.td_count = 0
+
+    def handle_data(self, data):
+        if self.in_td:
+            self.td_data.append(data)
+
 
 @dataclass
 class HomesideIdentity:
@@ -36,6 +108,7 @@ class HomesideClient:
         password: str | None = None,
     ) -> None:
         self._host = host
+        self._ws_url = f"ws://{host}{WS_PATH}"
         self._session = session
         self._username = username or ""
         self._password = password or ""
@@ -47,6 +120,7 @@ class HomesideClient:
         self._client_nonce1: int | None = None
         self._client_nonce2: int | None = None
         self._challenge_confirmation: int | None = None
+        self._credential_words: tuple[tuple[str, str], tuple[int, ...]] | None = None
         self._peek_context = 0
         self._advise_context = 200100
         self._items_per_read = 80
@@ -59,64 +133,109 @@ class HomesideClient:
         self._aes_key: bytes | None = None
         self._scbc_acc: bytearray | None = None  # Send CBC accumulator
         self._rcbc_acc: bytearray | None = None  # Receive CBC accumulator
-        self._encryptor: AES = None
-        self._decryptor: AES = None
+        self._encryptor: CipherContext | None = None
+        self._decryptor: CipherContext | None = None
 
     @property
     def identity(self) -> HomesideIdentity:
         return self._identity
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the WebSocket is open (a cheap, non-blocking check)."""
+        return self._ws is not None and not self._ws.closed
+
+    @property
+    def can_write(self) -> bool:
+        """Whether the session level allows writes (Operator (2) and above)."""
+        return self._session_level is None or self._session_level > 1
+
     @property
     def ws_url(self) -> str:
-        return f"ws://{self._host}{WS_PATH}"
+        return self._ws_url
+
+    def _reset_session_state(self) -> None:
+        """Forget per-connection auth/encryption state before a new handshake."""
+        self._authenticated = False
+        self._login_success = None
+        self._aes_key = None
+        self._scbc_acc = None
+        self._rcbc_acc = None
+        self._encryptor = None
+        self._decryptor = None
 
     async def connect(self) -> None:
         async with self._lock:
-            if self._ws and not self._ws.closed:
-                return
+            await self._connect_locked()
+
+    async def _connect_locked(self) -> None:
+        """Open a session unless one is open; caller holds the lock."""
+        if self._ws and not self._ws.closed:
+            return
+        # A dropped socket leaves the previous session's encryption state
+        # behind; the new handshake must start in plain JSON
+        self._reset_session_state()
+        try:
+            await self._handshake()
+        except BaseException:
+            # A half-finished handshake must not pass for a healthy session
+            await self._close_socket()
+            raise
+
+    async def _handshake(self) -> None:
+        """Open the socket and negotiate the session; caller holds the lock."""
+        try:
             self._ws = await self._session.ws_connect(
                 self.ws_url,
                 protocols=["EXOsocket"],
                 heartbeat=60,
                 receive_timeout=None,
             )
-            await self._send_json(
-                {
-                    "method": "versionOffer",
-                    "params": {"version": 1, "featureLevel": 0, "capabilities": 0},
-                }
-            )
-            await self._await_method("versionAck")
-            await self._send_json(
-                {
-                    "method": "identity",
-                    "params": {
-                        "implementation": "ControllerWebFramework",
-                        "implementationVersion": "2.0-0-00",
-                        "sessionID": 1,
-                    },
-                }
-            )
-            msg = await self._await_method("identity")
-            params = msg.get("params", {})
-            self._identity = HomesideIdentity(
-                controller_name=params.get("controllerName"),
-                project_name=params.get("projectName"),
-                serial=params.get("serial"),
-            )
+        except ClientError as err:
+            # Callers handle an unreachable controller as a ConnectionError
+            raise ConnectionError(f"Cannot connect to {self.ws_url}: {err}") from err
+        await self._send_json(
+            {
+                "method": "versionOffer",
+                "params": {"version": 1, "featureLevel": 0, "capabilities": 0},
+            }
+        )
+        await self._await_method("versionAck")
+        await self._send_json(
+            {
+                "method": "identity",
+                "params": {
+                    "implementation": "ControllerWebFramework",
+                    "implementationVersion": "2.0-0-00",
+                    "sessionID": 1,
+                },
+            }
+        )
+        msg = await self._await_method("identity")
+        params = msg.get("params", {})
+        self._identity = HomesideIdentity(
+            controller_name=params.get("controllerName"),
+            project_name=params.get("projectName"),
+            serial=params.get("serial"),
+        )
 
-            if self._username or self._password:
-                await self.login(self._username, self._password)
+        if self._username or self._password:
+            await self.login(self._username, self._password)
 
     async def close(self) -> None:
         async with self._lock:
-            if self._ws and not self._ws.closed:
-                await self._ws.close()
-            self._ws = None
+            await self._close_socket()
+
+    async def _close_socket(self) -> None:
+        """Close the socket and forget its session state; caller holds the lock."""
+        if self._ws and not self._ws.closed:
+            await self._ws.close()
+        self._ws = None
+        self._reset_session_state()
 
     async def ping(self) -> None:
         async with self._lock:
-            await self._send_json({"method": "ping"})
+            await self._send_text(_PING_MESSAGE)
             await self._await_method("pingAck")
 
     async def login(self, username: str, password: str) -> None:
@@ -167,11 +286,9 @@ class HomesideClient:
         await self._ws.send_bytes(self._scbc_acc)
         _LOGGER.debug("Sent client IV (%d bytes)", len(self._scbc_acc))
         
-        # Setup AES encryptor/decryptor with the key from auth
-        # Key was computed during _compute_auth_response
-        from Crypto.Cipher import AES as AESCipher
-        self._encryptor = AESCipher.new(self._aes_key, AESCipher.MODE_ECB)
-        self._decryptor = AESCipher.new(self._aes_key, AESCipher.MODE_ECB)
+        # Setup AES decryptor with the key from auth; the encryptor was
+        # already created for the challenge in _compute_auth_response
+        self._decryptor = Cipher(algorithms.AES(self._aes_key), modes.ECB()).decryptor()
         
         # Receive server's IV (RCBCacc - Receive CBC accumulator)
         msg = await self._ws.receive()
@@ -206,13 +323,31 @@ class HomesideClient:
         if not variables:
             return {}, {}
 
+        # Connect lazily: a dropped or never opened socket surfaces as a
+        # ConnectionError, after which the read is retried once on a new one
+        ws = self._ws
+        try:
+            return await self._read_points_once(variables, advise)
+        except ConnectionError as err:
+            _LOGGER.debug("Read failed (%s), reconnecting and retrying", err)
         async with self._lock:
-            objects = self._build_read_objects(variables)
+            # Concurrent failed reads reconnect once; later ones reuse the
+            # socket the first one opened
+            if self._ws is ws or not self.is_connected:
+                await self._close_socket()
+                await self._connect_locked()
+        return await self._read_points_once(variables, advise)
+
+    async def _read_points_once(
+        self, variables: list[str], advise: bool
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        async with self._lock:
+            batches = self._pack_read_objects(self._build_read_objects(variables))
             pending_contexts: set[int] = set()
-            for obj in objects:
+            for devices in batches:
                 context = self._next_context(advise=advise)
                 pending_contexts.add(context)
-                await self._send_json(self._build_read_message(context, obj))
+                await self._send_json(self._build_read_message(context, devices))
 
             updates = await self._await_updates(pending_contexts)
             values: dict[str, Any] = {}
@@ -238,7 +373,7 @@ class HomesideClient:
             ConnectionError: If WebSocket is not connected
         """
         # Guest (1) and None (0) users can only read, never write
-        if self._session_level is not None and self._session_level <= 1:
+        if not self.can_write:
             raise PermissionError(
                 f"Write operations not allowed for session level {self._session_level}. "
                 "Only Operator (2) and above can write."
@@ -300,151 +435,136 @@ class HomesideClient:
                 return False
 
     async def _send_json(self, payload: dict[str, Any]) -> None:
+        await self._send_text(_json_dumps(payload))
+
+    async def _send_text(self, text: str) -> None:
+        """Send an already serialized JSON message."""
         if not self._ws or self._ws.closed:
             raise ConnectionError("WebSocket is not connected")
         
         if self._authenticated:
             # Send encrypted
-            json_str = json.dumps(payload)
-            encrypted = self._encrypt_message(json_str)
-            await self._ws.send_bytes(encrypted)
+            await self._ws.send_bytes(self._encrypt_message(text))
         else:
             # Send plain JSON
-            await self._ws.send_json(payload)
+            await self._ws.send_str(text)
 
     async def _await_method(self, method: str) -> dict[str, Any]:
         return await self._await_message(method, field="method")
 
-    async def _await_message(self, name: str, field: str = "messageName") -> dict[str, Any]:
+    async def _await_message(
+        self, name: str, field: str = "messageName", timeout: float = 10.0
+    ) -> dict[str, Any]:
         if not self._ws or self._ws.closed:
             raise ConnectionError("WebSocket is not connected")
 
-        while True:
-            data = await self._receive_json()
-            if data is None:
-                continue
-
-            if data.get(field) == name:
-                return data
+        wanted = f'"{name}"'
+        try:
+            # One deadline for the whole wait, however many frames arrive
+            async with asyncio.timeout(timeout):
+                while True:
+                    data = await self._receive_json(wanted=wanted)
+                    if data is None:
+                        continue
+
+                    if data.get(field) == name:
+                        return data
+        except TimeoutError as err:
+            raise TimeoutError(f"Timed out waiting for {name}") from err
+
+    async def _fetch_debug_page(self, page: str) -> str | None:
+        """Return the HTML of a /debug page, or None if it could not be read."""
+        try:
+            url = f"http://{self._host}/debug/{page}"
+            async with self._session.get(url, timeout=5) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+        except Exception as e:
+            _LOGGER.debug("Failed to get %s info: %s", page, e)
+        return None
 
     async def get_debug_info(self) -> dict[str, Any]:
         """Get diagnostic information from device debug endpoints"""
-        import re
-        from html.parser import HTMLParser
-        
-        class DebugParser(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.data = {}
-                self.current_key = None
-                self.in_td = False
-                self.td_count = 0
-                self.td_data = []
-                
-            def handle_starttag(self, tag, attrs):
-                if tag == "td":
-                    self.in_td = True
-                    
-            def handle_endtag(self, tag):
-                if tag == "td":
-                    self.in_td = False
-                    self.td_count += 1
-                elif tag == "tr":
-                    if len(self.td_data) >= 2:
-                        key = self.td_data[0].strip()
-                        value = self.td_data[-1].strip()
-                        if key and value:
-                            self.data[key] = value
-                    self.td_data = []
-                    self.td_count = 0
-                    
-            def handle_data(self, data):
-                if self.in_td:
-                    self.td_data.append(data)
-        
         result = {}
+
+        # The pages are independent, so fetch them concurrently
+        mem_html, exoline_html, bacnet_html = await asyncio.gather(
+            self._fetch_debug_page("mem"),
+            self._fetch_debug_page("exoline"),
+            self._fetch_debug_page("bacnet"),
+        )
         
-        # Get memory info
-        try:
-            url = f"http://{self._host}/debug/mem"
-            async with self._session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    parser = DebugParser()
-                    parser.feed(html)
-                    
-                    # Extract HEAP info
-                    if "HEAP" in parser.data:
-                        # Parse "8192" from data
-                        for key, val in parser.data.items():
-                            if "Avail:" in key:
-                                match = re.search(r'(\d+)', val)
-                                if match:
-                                    result["heap_available"] = int(match.group(1))
-                            elif "Used:" in key:
-                                match = re.search(r'(\d+)', val)
-                                if match:
-                                    result["heap_used"] = int(match.group(1))
-                            elif "Max:" in key:
-                                match = re.search(r'(\d+)', val)
-                                if match:
-                                    result["heap_max"] = int(match.group(1))
-                            elif "Err:" in key:
-                                match = re.search(r'(\d+)', val)
-                                if match:
-                                    result["heap_errors"] = int(match.group(1))
-        except Exception as e:
-            _LOGGER.debug("Failed to get memory info: %s", e)
+        # Memory info
+        if mem_html is not None:
+            parser = _DebugParser()
+            parser.feed(mem_html)
+            
+            # Extract HEAP info
+            if "HEAP" in parser.data:
+                # Parse "8192" from data
+                for key, val in parser.data.items():
+                    if "Avail:" in key:
+                        match = _DIGITS_RE.search(val)
+                        if match:
+                            result["heap_available"] = int(match.group(1))
+                    elif "Used:" in key:
+                        match = _DIGITS_RE.search(val)
+                        if match:
+                            result["heap_used"] = int(match.group(1))
+                    elif "Max:" in key:
+                        match = _DIGITS_RE.search(val)
+                        if match:
+                            result["heap_max"] = int(match.group(1))
+                    elif "Err:" in key:
+                        match = _DIGITS_RE.search(val)
+                        if match:
+                            result["heap_errors"] = int(match.group(1))
         
-        # Get network info
-        try:
-            url = f"http://{self._host}/debug/exoline"
-            async with self._session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    # Extract EXOline sessions count
-                    match = re.search(r'EXOline TCP sessions[^<]*?(\d+)/(\d+)', html)
-                    if match:
-                        result["exoline_sessions_active"] = int(match.group(1))
-                        result["exoline_sessions_max"] = int(match.group(2))
-                    
-                    # Extract external IP if connected
-                    match = re.search(r'(\d+\.\d+\.\d+\.\d+)\s+\(reverse\)', html)
-                    if match:
-                        result["external_connection"] = match.group(1)
-                    else:
-                        result["external_connection"] = None
-                        
-                    # Extract Modbus sessions
-                    match = re.search(r'Modbus TCP sessions[^<]*?(\d+)/(\d+)', html)
-                    if match:
-                        result["modbus_sessions_active"] = int(match.group(1))
-                        result["modbus_sessions_max"] = int(match.group(2))
-        except Exception as e:
-            _LOGGER.debug("Failed to get network info: %s", e)
+        # Network info
+        if exoline_html is not None:
+            # Extract EXOline sessions count
+            match = _EXOLINE_SESSIONS_RE.search(exoline_html)
+            if match:
+                result["exoline_sessions_active"] = int(match.group(1))
+                result["exoline_sessions_max"] = int(match.group(2))
+            
+            # Extract external IP if connected
+            match = _REVERSE_IP_RE.search(exoline_html)
+            if match:
+                result["external_connection"] = match.group(1)
+            else:
+                result["external_connection"] = None
+                
+            # Extract Modbus sessions
+            match = _MODBUS_SESSIONS_RE.search(exoline_html)
+            if match:
+                result["modbus_sessions_active"] = int(match.group(1))
+                result["modbus_sessions_max"] = int(match.group(2))
         
-        # Get BACnet info
-        try:
-            url = f"http://{self._host}/debug/bacnet"
-            async with self._session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    match = re.search(r'version[^<]*?(\d+\.\d+\.\d+\.\d+)', html)
-                    if match:
-                        result["bacnet_version"] = match.group(1)
-                    match = re.search(r'device id[^<]*?(\d+)', html)
-                    if match:
-                        result["bacnet_device_id"] = int(match.group(1))
-        except Exception as e:
-            _LOGGER.debug("Failed to get BACnet info: %s", e)
+        # BACnet info
+        if bacnet_html is not None:
+            match = _BACNET_VERSION_RE.search(bacnet_html)
+            if match:
+                result["bacnet_version"] = match.group(1)
+            match = _BACNET_DEVICE_ID_RE.search(bacnet_html)
+            if match:
+                result["bacnet_device_id"] = int(match.group(1))
         
         return result
 
     async def ensure_connected(self) -> None:
-        if not self._ws or self._ws.closed:
+        if not self.is_connected:
             await self.connect()
 
-    async def _receive_json(self, timeout: float | None = None) -> dict[str, Any] | None:
+    async def _receive_json(
+        self, timeout: float | None = None, wanted: str | None = None
+    ) -> dict[str, Any] | None:
+        """Receive one message and parse it.
+
+        When wanted is given, messages whose raw text does not contain it are
+        dropped without being parsed (encrypted ones are still decrypted to
+        keep the receive chain in step).
+        """
         if not self._ws or self._ws.closed:
             raise ConnectionError("WebSocket is not connected")
 
@@ -454,9 +574,15 @@ class HomesideClient:
             raise TimeoutError("Timed out waiting for WebSocket message")
 
         if msg.type == WSMsgType.TEXT:
+            if (
+                wanted is not None
+                and wanted not in msg.data
+                and _IDENTITY_MARKER not in msg.data
+            ):
+                return None
             try:
-                data = json.loads(msg.data)
-            except json.JSONDecodeError:
+                data = _json_loads(msg.data)
+            except JSONDecodeError:
                 _LOGGER.debug("Skipping non-JSON message: %s", msg.data)
                 return None
 
@@ -474,7 +600,9 @@ class HomesideClient:
             if self._authenticated and self._rcbc_acc is not None:
                 try:
                     decrypted_text = self._decrypt_message(msg.data)
-                    data = json.loads(decrypted_text)
+                    if wanted is not None and wanted not in decrypted_text:
+                        return None
+                    data = _json_loads(decrypted_text)
                     _LOGGER.debug("Decrypted message: %s", data.get("method", "unknown"))
                     return data
                 except Exception as e:
@@ -496,36 +624,39 @@ class HomesideClient:
             return {}
 
         results: dict[int, dict[str, Any]] = {}
-        deadline = time.monotonic() + timeout
         pending = set(contexts)
 
-        while pending:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                raise TimeoutError("Timed out waiting for update messages")
-
-            data = await self._receive_json(timeout=remaining)
-            if not data:
-                continue
-            if data.get("method") != "update":
-                continue
-
-            context = data.get("context")
-            if context in pending:
-                results[context] = self._parse_update_details(data)
-                pending.remove(context)
+        try:
+            # One deadline for the whole wait, however many frames arrive
+            async with asyncio.timeout(timeout):
+                while pending:
+                    data = await self._receive_json(wanted=_UPDATE_MARKER)
+                    if not data:
+                        continue
+                    if data.get("method") != "update":
+                        continue
+
+                    context = data.get("context")
+                    if context in pending:
+                        results[context] = self._parse_update_details(data)
+                        pending.remove(context)
+        except TimeoutError as err:
+            raise TimeoutError("Timed out waiting for update messages") from err
 
         return results
 
-    def _build_read_message(self, context: int, device_items: dict[str, Any]) -> dict[str, Any]:
+    def _build_read_message(
+        self, context: int, devices: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         return {
             "method": "read",
             "context": context,
-            "params": {"kind": "indexedPoints", "devices": [device_items]},
+            "params": {"kind": "indexedPoints", "devices": devices},
         }
 
     def _build_read_objects(self, variables: list[str]) -> list[dict[str, Any]]:
-        grouped: dict[int, list[int]] = {}
+        # Per-device dicts keep first-seen item order and dedupe in O(1)
+        grouped: dict[int, dict[int, None]] = {}
         for var in variables:
             if ":" not in var:
                 _LOGGER.debug("Skipping variable without device:item format: %s", var)
@@ -538,28 +669,49 @@ class HomesideClient:
                 _LOGGER.debug("Skipping invalid variable address: %s", var)
                 continue
 
-            grouped.setdefault(device, [])
-            if item not in grouped[device]:
-                grouped[device].append(item)
+            grouped.setdefault(device, {})[item] = None
 
         objects: list[dict[str, Any]] = []
-        for device, items in grouped.items():
+        for device, unique_items in grouped.items():
             items_per_read = (
                 self._items_per_read
                 if device == 0
                 else self._slave_items_per_read
             )
-            remaining = list(items)
-            while remaining:
-                if len(remaining) < items_per_read + self._items_per_read_min_limit:
-                    chunk = remaining
-                    remaining = []
+            items = list(unique_items)
+            count = len(items)
+            start = 0
+            # Fixed-size chunks; a short tail (under items_per_read_min_limit
+            # past a full chunk) is folded into the last chunk
+            while start < count:
+                if count - start < items_per_read + self._items_per_read_min_limit:
+                    end = count
                 else:
-                    chunk = remaining[:items_per_read]
-                    remaining = remaining[items_per_read:]
-                objects.append({"device": device, "items": chunk})
+                    end = start + items_per_read
+                objects.append({"device": device, "items": items[start:end]})
+                start = end
         return objects
 
+    def _pack_read_objects(
+        self, objects: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """Group device objects into read messages of at most _items_per_read items.
+
+        A read carries a list of devices, so small groups from different
+        devices share one message instead of costing a frame each.
+        """
+        batches: list[list[dict[str, Any]]] = []
+        batch_items = 0
+        for obj in objects:
+            count = len(obj["items"])
+            if batches and batch_items + count <= self._items_per_read:
+                batches[-1].append(obj)
+                batch_items += count
+            else:
+                batches.append([obj])
+                batch_items = count
+        return batches
+
     def _parse_update(self, data: dict[str, Any]) -> dict[str, Any]:
         return self._parse_update_details(data)["values"]
 
@@ -569,28 +721,24 @@ class HomesideClient:
         values: dict[str, Any] = {}
         errors: dict[str, dict[str, Any]] = {}
         for device_block in devices:
-            device = device_block.get("device")
+            prefix = f"{device_block.get('device')}:"
             items = device_block.get("items", [])
-            device_values = device_block.get("values", [])
-            device_errors = device_block.get("errors", [])
-            for idx, item in enumerate(items):
-                key = f"{device}:{item}"
-                error = device_errors[idx] if idx < len(device_errors) else None
-                value = device_values[idx] if idx < len(device_values) else None
-                if error not in (None, 0):
-                    _LOGGER.debug(
-                        "Read error for %s: %s (%s)",
-                        key,
-                        error,
-                        self._error_text(error),
-                    )
-                    errors[key] = {
-                        "code": error,
-                        "text": self._error_text(error),
-                    }
-                    values[key] = None
-                else:
+            count = len(items)
+            # Walk items, values and errors in one pass; missing trailing
+            # values/errors are padded with None
+            for item, value, error in zip_longest(
+                items,
+                device_block.get("values", [])[:count],
+                device_block.get("errors", [])[:count],
+            ):
+                key = prefix + str(item)
+                if error is None or error == 0:
                     values[key] = value
+                    continue
+                text = self._error_text(error)
+                _LOGGER.debug("Read error for %s: %s (%s)", key, error, text)
+                errors[key] = {"code": error, "text": text}
+                values[key] = None
         return {"values": values, "errors": errors}
 
     def _next_context(self, advise: bool = False) -> int:
@@ -618,7 +766,7 @@ class HomesideClient:
 
     @staticmethod
     def _swap_end(value: int) -> int:
-        return int.from_bytes(value.to_bytes(4, "big"), "little")
+        return _U32_LE.unpack(_U32_BE.pack(value))[0]
 
     def _compute_auth_response(
         self, username: str, password: str, server_nonce: int
@@ -626,36 +774,39 @@ class HomesideClient:
         client_nonce2 = self._swap_end(self._rand_u32())
         # NOTE: Web UI converts username to lowercase before hashing
         # See app.main.min.js.raw.js: i.toLowerCase()+String.fromCharCode(0)+r+String.fromCharCode(0)
-        payload = f"{username.lower()}\x00{password}\x00".encode("utf-8")
-        digest = hashlib.sha256(payload).digest()
-        words = [
-            int.from_bytes(digest[i : i + 4], "big")
-            for i in range(0, 32, 4)
-        ]
+        credentials = (username, password)
+        if self._credential_words is None or self._credential_words[0] != credentials:
+            payload = f"{username.lower()}\x00{password}\x00".encode("utf-8")
+            digest = hashlib.sha256(payload).digest()
+            # The credential digest only changes with the credentials, so it
+            # is hashed once and reused for every later challenge
+            self._credential_words = (
+                credentials,
+                _DIGEST_WORDS.unpack(digest),
+            )
+        words = list(self._credential_words[1])
 
         words[5] ^= self._swap_end(self._client_nonce1 or 0)
         words[6] ^= self._swap_end(server_nonce)
         words[7] ^= self._swap_end(client_nonce2)
 
-        key_words = [
+        key = _BLOCK_WORDS.pack(
             words[0] ^ words[4],
             words[1] ^ words[5],
             words[2] ^ words[6],
             words[3] ^ words[7],
-        ]
-        key = b"".join(w.to_bytes(4, "big") for w in key_words)
+        )
         
         # Store AES key for later encryption/decryption
         self._aes_key = key
 
-        block_words = words[4:8]
-        block = b"".join(w.to_bytes(4, "big") for w in block_words)
-        cipher = AES.new(key, AES.MODE_ECB)
-        enc = cipher.encrypt(block)
-        word0 = int.from_bytes(enc[0:4], "big")
-        word1 = int.from_bytes(enc[4:8], "big")
-        confirmation = self._swap_end(word1)
-        response = self._swap_end(word0)
+        block = _BLOCK_WORDS.pack(*words[4:8])
+        # ECB keeps no state between blocks, so the context that encrypts the
+        # challenge is reused as the session encryptor instead of re-keying
+        encryptor = Cipher(algorithms.AES(key), modes.ECB()).encryptor()
+        self._encryptor = encryptor
+        enc = encryptor.update(block)
+        response, confirmation = _AUTH_REPLY_WORDS.unpack_from(enc)
         return client_nonce2, response, confirmation
 
     def _encrypt_message(self, text: str) -> bytes:
@@ -693,7 +844,7 @@ class HomesideClient:
                 block[j] = self._scbc_acc[j] ^ output[i + j]
             
             # Encrypt block
-            encrypted = self._encryptor.encrypt(bytes(block))
+            encrypted = self._encryptor.update(bytes(block))
             
             # XOR encrypted result with original block and store
             for j in range(16):
@@ -718,7 +869,7 @@ class HomesideClient:
             enc_block = data[i:i+16]
             
             # Decrypt block
-            decrypted = self._decryptor.decrypt(enc_block)
+            decrypted = self._decryptor.update(enc_block)
             
             # XOR with RCBCacc and store
             for j in range(16):
@@ -16,6 +16,15 @@ UPDATE_INTERVAL_SLOW = 300  # Configuration, version info, calibration
 UPDATE_INTERVAL_VERY_SLOW = 3600  # Static info like serial numbers
 UPDATE_INTERVAL_DIAGNOSTIC = 1800  # System diagnostics (30 minutes)
 
+# Adaptive polling: each read that returns an unchanged value stretches that
+# address's interval by this factor, up to this multiple of its base interval
+ADAPTIVE_BACKOFF_FACTOR = 2
+ADAPTIVE_MAX_BACKOFF = 4
+
+# Refresh requests (e.g. after writes) arriving within this many seconds are
+# coalesced into one read
+REQUEST_REFRESH_COOLDOWN = 0.5
+
 # Session level to role mapping (shared with CLI)
 SESSION_LEVEL_ROLES = {
     0: "None",
@@ -0,0 +1,167 @@
+"""Shared polling coordinator for HomeSide variables."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .client import HomesideClient
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_MAX_BACKOFF,
+    REQUEST_REFRESH_COOLDOWN,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_SLOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HomesideDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll many addresses with per-address intervals in one request per tick.
+
+    One instance is shared by every platform of a config entry. The
+    coordinator ticks at UPDATE_INTERVAL_FAST. Each tick reads only the
+    addresses whose interval has elapsed, in a single read_points_with_errors()
+    call, and merges the result into the previous data. Data is keyed by
+    address: {"values": {address: value}, "errors": {address: error}}.
+
+    Slow and very slow intervals (curves, modes, setpoints) adapt to how
+    often a value changes: every unchanged read stretches the address's
+    interval by ADAPTIVE_BACKOFF_FACTOR (capped at ADAPTIVE_MAX_BACKOFF times
+    its base interval); a change, an error or a write drops it back to the
+    base interval. Faster addresses (outputs, temperatures, statuses) always
+    keep their base interval so their changes show up promptly.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: HomesideClient, name: str) -> None:
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            name=name,
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_FAST),
+            always_update=False,
+            # Coalesce bursts of post-write refresh requests into one read, run
+            # as a background task so service calls return without waiting
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+                background=True,
+            ),
+        )
+        self._client = client
+        self._intervals: dict[str, float] = {}  # Base interval per address
+        self._backoff: dict[str, float] = {}  # Current (stretched) interval
+        self._next_due: dict[str, float] = {}
+
+    def add_address(self, address: str, interval: float) -> None:
+        """Poll address every interval seconds (shortest interval wins)."""
+        current = self._intervals.get(address)
+        if current is None or interval < current:
+            self._intervals[address] = interval
+        self._backoff[address] = self._intervals[address]
+        # Only addresses no platform has added before need an immediate read
+        self._next_due.setdefault(address, 0.0)
+
+    async def async_refresh_new_addresses(self) -> None:
+        """Refresh now unless every added address already has a result.
+
+        Platforms share this coordinator, so their setup only has to wait for
+        a read when it added addresses the coordinator has not fetched yet.
+        """
+        data = self.data
+        if data is not None:
+            values = data["values"]
+            errors = data["errors"]
+            if all(
+                address in values or address in errors for address in self._intervals
+            ):
+                return
+        await self.async_refresh()
+
+    async def async_refresh_address(self, address: str) -> None:
+        """Re-read address on the next (debounced) refresh, e.g. after a write."""
+        self._backoff[address] = self._intervals[address]
+        self._next_due[address] = 0.0
+        await self.async_request_refresh()
+
+    @callback
+    def async_set_value(self, address: str, value: Any) -> None:
+        """Publish a value known to be current, e.g. an acknowledged write."""
+        if address in self._intervals:
+            self._backoff[address] = self._intervals[address]
+        data = self.data or {"values": {}, "errors": {}}
+        errors = data["errors"]
+        if address in errors:
+            errors = {key: error for key, error in errors.items() if key != address}
+        # Not async_set_updated_data(): that cancels the debounced refresh,
+        # dropping re-reads other writes queued in the same cooldown window
+        self.data = {"values": {**data["values"], address: value}, "errors": errors}
+        self.async_update_listeners()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        now = time.monotonic()
+        next_due = self._next_due
+        due = [address for address, due_at in next_due.items() if due_at <= now]
+        if not due:
+            return self.data or {"values": {}, "errors": {}}
+
+        # Platforms refresh concurrently during setup; claim the due addresses
+        # up front so overlapping refreshes don't read them twice
+        backoff = self._backoff
+        for address in due:
+            next_due[address] = now + backoff[address]
+
+        read_ok = False
+        try:
+            values, errors = await self._client.read_points_with_errors(due)
+            read_ok = True
+        except (ConnectionError, TimeoutError) as err:
+            raise UpdateFailed(f"Error reading HomeSide variables: {err}") from err
+        finally:
+            if not read_ok:
+                # Retry the claimed addresses on the next tick
+                for address in due:
+                    next_due[address] = 0.0
+
+        # Merge into the data as it is now, not as it was before the read, so
+        # results of a refresh that finished meanwhile are kept
+        previous = self.data or {"values": {}, "errors": {}}
+
+        # Stretch the interval of unchanged slow-tier values, reset it on any
+        # change; faster tiers are never stretched
+        intervals = self._intervals
+        previous_values = previous["values"]
+        for address in due:
+            base = intervals[address]
+            value = values.get(address)
+            if (
+                base < UPDATE_INTERVAL_SLOW
+                or value is None
+                or value != previous_values.get(address)
+            ):
+                interval = base
+            else:
+                interval = min(
+                    backoff[address] * ADAPTIVE_BACKOFF_FACTOR,
+                    base * ADAPTIVE_MAX_BACKOFF,
+                )
+            backoff[address] = interval
+            next_due[address] = now + interval
+
+        # Build new dicts so listeners can tell old and new data apart
+        due_set = set(due)
+        merged_errors = {
+            address: error
+            for address, error in previous["errors"].items()
+            if address not in due_set
+        }
+        merged_errors.update(errors)
+        return {"values": {**previous["values"], **values}, "errors": merged_errors}
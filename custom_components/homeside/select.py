@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
 import logging
-from pathlib import Path
+from operator import itemgetter
 from typing import Any
 from datetime import timedelta
 
@@ -17,79 +15,15 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from ._vars import VariableConfig, async_get_variable_configs, uid_slug
 from .client import HomesideClient
+from .coordinator import HomesideDataUpdateCoordinator
 from .const import DOMAIN, UPDATE_INTERVAL_NORMAL
 
 _LOGGER = logging.getLogger(__name__)
-_VARIABLES_FILE = Path(__file__).resolve().parent / "variables.json"
 
-
-@dataclass(frozen=True, kw_only=True)
-class VariableConfig:
-    key: str  # Descriptive key from variables.json
-    name: str
-    enabled: bool
-    type: str
-    note: str | None = None
-    access: str | None = None
-    role_access: str | None = None
-    address: list[str]  # Address(es) for this entity
-    format: str | None = None
-    options: list[str] | None = None
-    values: list[int] | None = None
-
-
-def _load_variable_configs() -> list[VariableConfig]:
-    """Load variables from variables.json."""
-    if not _VARIABLES_FILE.exists():
-        return []
-    
-    try:
-        raw = json.loads(_VARIABLES_FILE.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
-        _LOGGER.warning("Failed to read variables mapping: %s", exc)
-        return []
-    
-    default_role_access = raw.get("role_access_default") or "Guest"
-    
-    configs: list[VariableConfig] = []
-    for key, info in (raw.get("mapping") or {}).items():
-        if not key or not isinstance(key, str):
-            continue
-        if not isinstance(info, dict):
-            continue
-        
-        address = info.get("address")
-        if not address or not isinstance(address, list):
-            continue
-        
-        name = str(info.get("name") or key)
-        enabled = bool(info.get("enabled", False))
-        vtype = str(info.get("type") or "sensor")
-        note = info.get("note")
-        access = info.get("access")
-        role_access = info.get("role_access") or default_role_access
-        format_template = info.get("format")
-        options = info.get("options")
-        values = info.get("values")
-        
-        configs.append(
-            VariableConfig(
-                key=key,
-                name=name,
-                enabled=enabled,
-                type=vtype,
-                note=note,
-                access=access,
-                role_access=role_access,
-                address=address,
-                format=format_template,
-                options=options,
-                values=values,
-            )
-        )
-    
-    return configs
+# Shared stand-in for coordinator data before the first successful refresh
+_EMPTY: dict[str, dict[str, Any]] = {"values": {}, "errors": {}}
 
 
 async def async_setup_entry(
@@ -101,22 +35,27 @@ async def async_setup_entry(
     client: HomesideClient = hass.data[DOMAIN][entry.entry_id]["client"]
     device_id = hass.data[DOMAIN][entry.entry_id]["device_id"]
 
-    variable_configs = _load_variable_configs()
+    variable_configs = await async_get_variable_configs(hass)
     # Session-level filtering
     from .const import ROLE_HIERARCHY
     session_level = getattr(client, '_session_level', None)
     allowed_roles = set()
     if session_level is not None:
         allowed_roles = set(ROLE_HIERARCHY[: session_level + 1])
-    # Create select entities from variables with type="select"
-    select_configs = [
-        cfg for cfg in variable_configs
-        if cfg.enabled and cfg.type == "select" and cfg.options and cfg.values
-        and (not cfg.role_access or cfg.role_access in allowed_roles)
-    ]
-    # Separate combined from regular selects
-    combined_selects = [cfg for cfg in select_configs if cfg.address]
-    regular_selects = [cfg for cfg in select_configs if not cfg.address]
+    # Create select entities from variables with type="select", separating
+    # combined from regular selects in the same pass
+    combined_selects: list[VariableConfig] = []
+    regular_selects: list[VariableConfig] = []
+    for cfg in variable_configs:
+        if not cfg.enabled or cfg.type != "select" or not cfg.options or not cfg.values:
+            continue
+        if cfg.role_access and cfg.role_access not in allowed_roles:
+            continue
+        count = len(cfg.address)
+        if count > 1:
+            combined_selects.append(cfg)
+        elif count == 1:
+            regular_selects.append(cfg)
     if not regular_selects and not combined_selects:
         return
     
@@ -124,33 +63,19 @@ async def async_setup_entry(
     
     # Regular selects
     if regular_selects:
-        # Create coordinator for select updates
-        async def _update() -> dict[str, Any]:
-            await client.ensure_connected()
-            data = {}
-            for cfg in regular_selects:
-                try:
-                    value = await client.read_point(cfg.address[0])
-                    if value is not None:
-                        data[cfg.name] = value
-                except Exception as e:
-                    _LOGGER.debug(f"Error reading {cfg.address[0]}: {e}")
-            return data
-
-        coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name="homeside_selects",
-            update_method=_update,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
+        # Select values are polled by the entry's shared coordinator
+        coordinator: HomesideDataUpdateCoordinator = (
+            hass.data[DOMAIN][entry.entry_id]["coordinator"]
         )
+        for cfg in regular_selects:
+            coordinator.add_address(cfg.address[0], UPDATE_INTERVAL_NORMAL)
 
-        await coordinator.async_config_entry_first_refresh()
+        await coordinator.async_refresh_new_addresses()
 
-        entities.extend([
+        entities.extend(
             HomesideSelect(coordinator, client, device_id, cfg)
             for cfg in regular_selects
-        ])
+        )
     
     # Combined selects (read-only)
     if combined_selects:
@@ -158,34 +83,42 @@ async def async_setup_entry(
             if not cfg.address:
                 continue
             
-            variables = cfg.address
-            
-            async def _update_combined(vars=variables, fmt=cfg.format, cfg_name=cfg.name) -> dict[str, Any]:
-                await client.ensure_connected()
+            async def _update_combined(
+                vars=tuple(cfg.address),
+                getter=itemgetter(*cfg.address),
+                fmt=cfg.format,
+                cfg_name=cfg.name,
+            ) -> dict[str, Any]:
                 values, errors = await client.read_points_with_errors(vars)
-                
-                # Apply format template
-                if fmt and all(addr in values for addr in vars):
-                    try:
-                        formatted_value = fmt.format(*[values[addr] for addr in vars])
-                    except (KeyError, IndexError, ValueError) as e:
-                        _LOGGER.warning("Failed to format combined select %s: %s", cfg_name, e)
-                        formatted_value = None
+                formatted_value = None
+                try:
+                    args = getter(values)
+                except KeyError:
+                    # Some source was not returned at all
+                    get = values.get
+                    sources = {addr: get(addr) for addr in vars}
                 else:
-                    formatted_value = None
+                    sources = dict(zip(vars, args))
+                    # Apply format template (only when every source has a value)
+                    if fmt and None not in args:
+                        try:
+                            formatted_value = fmt.format(*args)
+                        except (KeyError, IndexError, ValueError) as e:
+                            _LOGGER.warning("Failed to format combined select %s: %s", cfg_name, e)
                 
                 return {
                     "value": formatted_value,
-                    "sources": {addr: values.get(addr) for addr in vars},
-                    "errors": {addr: errors.get(addr) for addr in vars},
+                    "sources": sources,
+                    "errors": {addr: errors[addr] for addr in vars if errors.get(addr)},
                 }
             
             combined_coordinator = DataUpdateCoordinator(
                 hass,
                 logger=_LOGGER,
-                name=f"homeside_combined_select_{cfg.address[0].replace(':', '_')}",
+                name=f"homeside_combined_select_{uid_slug(cfg.address[0])}",
                 update_method=_update_combined,
                 update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
+                always_update=False,
             )
             
             await combined_coordinator.async_refresh()
@@ -194,15 +127,17 @@ async def async_setup_entry(
             )
 
     async_add_entities(entities)
-    _LOGGER.info(f"Added {len(entities)} Homeside select entities")
+    _LOGGER.info("Added %d Homeside select entities", len(entities))
 
 
 class HomesideSelect(CoordinatorEntity, SelectEntity):
     """Representation of a Homeside select entity (mode selector)."""
 
+    coordinator: HomesideDataUpdateCoordinator
+
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: HomesideDataUpdateCoordinator,
         client: HomesideClient,
         device_id: str,
         config: VariableConfig,
@@ -211,59 +146,53 @@ class HomesideSelect(CoordinatorEntity, SelectEntity):
         super().__init__(coordinator)
         self._client = client
         self._device_id = device_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
         self._config = config
         self._name = config.name
+        self._address = config.address[0]
         self._attr_name = f"Homeside {config.name}"
-        self._attr_unique_id = f"homeside_{config.key.replace(":", "_").replace("/", "_")}"
+        self._attr_unique_id = f"homeside_{uid_slug(config.key)}"
         self._attr_options = config.options or []
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
+        # Map between controller values and option labels in both directions,
+        # keeping the first match like the list lookups this replaces
+        self._value_to_option: dict[int, str] = {}
+        self._option_to_value: dict[str, int] = {}
+        for option, value in zip(config.options or (), config.values or ()):
+            self._value_to_option.setdefault(value, option)
+            self._option_to_value.setdefault(option, value)
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        value = self.coordinator.data.get(self._name)
-        # Try to get error info if available
-        errors = getattr(self.coordinator, 'data', {}).get('errors', {}) if hasattr(self.coordinator, 'data') else {}
-        error = errors.get(self._name) if errors else None
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
-        if error and error.get("code") == 47 and value is None:
-            value = none_value_default
+        data = self.coordinator.data or _EMPTY
+        value = data["values"].get(self._address)
         if value is None:
-            return None
+            error = data["errors"].get(self._address)
+            if error and error.get("code") == 47:
+                value = self._config.none_value
+            if value is None:
+                return None
         # Map numeric value to option string
         try:
-            idx = self._config.values.index(int(value))
-            return self._config.options[idx]
-        except (ValueError, IndexError, AttributeError):
+            return self._value_to_option.get(int(value))
+        except (TypeError, ValueError):
             return None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        try:
-            idx = self._config.options.index(option)
-            value = self._config.values[idx]
-            
-            await self._client.write_point(self._config.address[0], value)
-            await self.coordinator.async_request_refresh()
-        except (ValueError, AttributeError):
-            _LOGGER.error(f"Invalid option {option} for {self._config.address[0]}")
+        value = self._option_to_value.get(option)
+        if value is None:
+            _LOGGER.error("Invalid option %s for %s", option, self._address)
+            return
+
+        if await self._client.write_point(self._address, value):
+            # The write was acknowledged, so publish the new value directly
+            # instead of re-reading it from the controller
+            self.coordinator.async_set_value(self._address, value)
 
 
 class HomesideCombinedSelect(SelectEntity):
@@ -281,19 +210,28 @@ class HomesideCombinedSelect(SelectEntity):
         self._coordinator = coordinator
         self._config = config
         self._device_id = device_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
         self._name = config.name
-        self._attr_unique_id = f"homeside_combined_{config.key.replace(":", "_").replace("/", "_")}_select"
+        self._attr_unique_id = f"homeside_combined_{uid_slug(config.key)}_select"
         self._attr_name = f"Homeside {config.name}"
         self._attr_options = config.options or ["Unknown"]
         
         # Combined selects are read-only
-        self._attr_entity_category = EntityCategory.Select
-    
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("address", config.address),
+                ("format", config.format),
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
         }
     
     @property
@@ -306,17 +244,7 @@ class HomesideCombinedSelect(SelectEntity):
         data = self._coordinator.data or {}
         value = data.get("value")
         errors = data.get("errors", {})
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
+        none_value_default = self._config.none_value
         # If any error for a source is code 47 and value is None, use fallback
         if any((err and err.get("code") == 47 and value is None) for err in errors.values()):
             value = none_value_default
@@ -333,32 +261,17 @@ class HomesideCombinedSelect(SelectEntity):
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra attributes."""
         data = self._coordinator.data or {}
-        sources = data.get("sources", {})
-        errors = data.get("errors", {})
-        
-        extra: dict[str, Any] = {}
-        
+        sources = data.get("sources")
+        errors = data.get("errors")
+        if not sources and not errors:
+            return self._static_attrs or None
+
+        extra: dict[str, Any] = {**self._static_attrs}
         if sources:
             extra["sources"] = sources
-        
-        if self._config.address:
-            extra["address"] = self._config.address
-        
-        if self._config.format:
-            extra["format"] = self._config.format
-        
-        if self._config.note:
-            extra["note"] = self._config.note
-        
-        if self._config.access:
-            extra["access"] = self._config.access
-        if self._config.role_access:
-            extra["role_access"] = self._config.role_access
-        
-        if any(errors.values()):
-            extra["errors"] = {k: v for k, v in errors.items() if v}
-        
-        return extra or None
+        if errors:
+            extra["errors"] = errors
+        return extra
     
     async def async_update(self) -> None:
         """Update the entity."""
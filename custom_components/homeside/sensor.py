@@ -1,30 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-import json
+from itertools import chain
 import logging
-from pathlib import Path
 from typing import Any
 from datetime import timedelta
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
+from ._vars import (
+    VariableConfig,
+    async_get_variable_configs,
+    classify_update_group,
+    uid_slug,
+)
 from .client import HomesideClient
+from .coordinator import HomesideDataUpdateCoordinator
 from .const import (
     DOMAIN,
-    FAST_UPDATE_PATTERNS,
-    NORMAL_UPDATE_PATTERNS,
-    SLOW_UPDATE_PATTERNS,
-    VERY_SLOW_UPDATE_PATTERNS,
-    UPDATE_INTERVAL_FAST,
     UPDATE_INTERVAL_NORMAL,
-    UPDATE_INTERVAL_SLOW,
-    UPDATE_INTERVAL_VERY_SLOW,
     UPDATE_INTERVAL_DIAGNOSTIC,
     DIAGNOSTIC_SENSORS,
     SESSION_LEVEL_ROLES,
@@ -33,24 +36,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-_VARIABLES_FILE = Path(__file__).resolve().parent / "variables.json"
+# Shared stand-in for coordinator data before the first successful refresh
+_EMPTY: dict[str, dict[str, Any]] = {"values": {}, "errors": {}}
 
 
-@dataclass(frozen=True, kw_only=True)
-class VariableConfig:
-    key: str  # Descriptive key from variables.json
-    name: str
-    enabled: bool
-    type: str
-    note: str | None = None
-    access: str | None = None
-    role_access: str | None = None
-    unit: str | None = None
-    device_class: str | None = None
-    address: list[str]  # Address(es) for this entity
-    format: str | None = None
-    decimals: int | None = None
-
 @dataclass(frozen=True, kw_only=True)
 class HomesideSensorEntityDescription(SensorEntityDescription):
     key: str
@@ -90,147 +79,71 @@ async def async_setup_entry(
         name="homeside_identity",
         update_method=_update,
         update_interval=None,
+        always_update=False,
     )
 
     await coordinator.async_refresh()
-    entities: list[SensorEntity] = []
+    # Entity groups are generators, materialized once by async_add_entities
+    entity_groups: list[Iterable[SensorEntity]] = []
     
     # Only add identity sensors if diagnostic is enabled
     if show_diagnostic:
-        entities.extend([
+        entity_groups.append(
             HomesideIdentitySensor(coordinator, description, device_id) for description in SENSORS
-        ])
+        )
 
-    variable_configs = _load_variable_configs()
+    variable_configs = await async_get_variable_configs(hass)
     # Session-level filtering
     from .const import ROLE_HIERARCHY
     session_level = getattr(client, '_session_level', None)
     allowed_roles = set()
     if session_level is not None:
         allowed_roles = set(ROLE_HIERARCHY[: session_level + 1])
-    sensor_configs = [
-        cfg for cfg in variable_configs
-        if cfg.enabled and cfg.type == "sensor" and (
-            not cfg.role_access or cfg.role_access in allowed_roles
-        )
-    ]
-    
-    # Separate multi-variable combined sensors from single-variable sensors
-    combined_sensors = [cfg for cfg in sensor_configs if len(cfg.address) > 1]
-    regular_sensors = [cfg for cfg in sensor_configs if len(cfg.address) == 1]
+    # Filter and separate multi-variable combined sensors from
+    # single-variable sensors in one pass
+    combined_sensors: list[VariableConfig] = []
+    regular_sensors: list[VariableConfig] = []
+    for cfg in variable_configs:
+        if not cfg.enabled or cfg.type != "sensor":
+            continue
+        if cfg.role_access and cfg.role_access not in allowed_roles:
+            continue
+        count = len(cfg.address)
+        if count > 1:
+            combined_sensors.append(cfg)
+        elif count == 1:
+            regular_sensors.append(cfg)
     
-    if regular_sensors:
-        # Group sensors by update interval
-        fast_sensors = []
-        normal_sensors = []
-        slow_sensors = []
-        very_slow_sensors = []
-        
-        for cfg in regular_sensors:
-            name_lower = cfg.name.lower()
-            if any(pattern in name_lower for pattern in VERY_SLOW_UPDATE_PATTERNS):
-                very_slow_sensors.append(cfg)
-            elif any(pattern in name_lower for pattern in SLOW_UPDATE_PATTERNS):
-                slow_sensors.append(cfg)
-            elif any(pattern in name_lower for pattern in FAST_UPDATE_PATTERNS):
-                fast_sensors.append(cfg)
-            else:
-                normal_sensors.append(cfg)
-        
-        # Create coordinators for each update group
-        sensor_groups = [
-            (fast_sensors, UPDATE_INTERVAL_FAST, "fast"),
-            (normal_sensors, UPDATE_INTERVAL_NORMAL, "normal"),
-            (slow_sensors, UPDATE_INTERVAL_SLOW, "slow"),
-            (very_slow_sensors, UPDATE_INTERVAL_VERY_SLOW, "very_slow"),
-        ]
-        
-        for group_configs, interval, group_name in sensor_groups:
-            if not group_configs:
-                continue
-                
-            variables = [cfg.address[0] for cfg in group_configs]
-            name_by_address = {cfg.address[0]: cfg.name for cfg in group_configs}
-            note_by_address = {cfg.address[0]: cfg.note for cfg in group_configs}
-            access_by_address = {cfg.address[0]: cfg.access for cfg in group_configs}
-            role_by_address = {cfg.address[0]: cfg.role_access for cfg in group_configs}
-
-            async def _update_variables(vars=variables, names=name_by_address, notes=note_by_address, access=access_by_address, roles=role_by_address) -> dict[str, Any]:
-                await client.ensure_connected()
-                values, errors = await client.read_points_with_errors(vars)
-                mapped_values = {names[address]: values.get(address) for address in vars}
-                mapped_errors = {names[address]: errors.get(address) for address in vars}
-                mapped_notes = {names[address]: notes.get(address) for address in vars}
-                mapped_access = {names[address]: access.get(address) for address in vars}
-                mapped_roles = {names[address]: roles.get(address) for address in vars}
-                return {
-                    "values": mapped_values,
-                    "errors": mapped_errors,
-                    "notes": mapped_notes,
-                    "access": mapped_access,
-                    "role_access": mapped_roles,
-                }
-
-            variables_coordinator = DataUpdateCoordinator(
-                hass,
-                logger=_LOGGER,
-                name=f"homeside_variables_{group_name}",
-                update_method=_update_variables,
-                update_interval=timedelta(seconds=interval),
-            )
+    # The entry's shared coordinator polls every variable; each address is
+    # only read when its update group's interval has elapsed
+    variables_coordinator: HomesideDataUpdateCoordinator = (
+        hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    )
 
-            await variables_coordinator.async_refresh()
-            entities.extend(
-                HomesideVariableSensor(variables_coordinator, cfg, device_id)
-                for cfg in group_configs
-            )
+    for cfg in regular_sensors:
+        _group, interval = classify_update_group(cfg.name_lower)
+        variables_coordinator.add_address(cfg.address[0], interval)
     
-    # Add combined sensors
-    if combined_sensors:
-        # Group combined sensors that share the same sources together
-        for cfg in combined_sensors:
-            if not cfg.address:
-                continue
-            
-            variables = cfg.address
-            
-            async def _update_combined(vars=variables, fmt=cfg.format, cfg_name=cfg.name) -> dict[str, Any]:
-                await client.ensure_connected()
-                values, errors = await client.read_points_with_errors(vars)
-                
-                # Apply format template
-                if fmt and all(addr in values for addr in vars):
-                    try:
-                        formatted_value = fmt.format(*[values[addr] for addr in vars])
-                    except (KeyError, IndexError, ValueError) as e:
-                        _LOGGER.warning("Failed to format combined sensor %s: %s", cfg_name, e)
-                        formatted_value = None
-                else:
-                    formatted_value = None
-                
-                return {
-                    "value": formatted_value,
-                    "sources": {addr: values.get(addr) for addr in vars},
-                    "errors": {addr: errors.get(addr) for addr in vars},
-                }
-            
-            combined_coordinator = DataUpdateCoordinator(
-                hass,
-                logger=_LOGGER,
-                name=f"homeside_combined_{cfg.address[0].replace(':', '_')}",
-                update_method=_update_combined,
-                update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
-            )
-            
-            await combined_coordinator.async_refresh()
-            entities.append(
-                HomesideCombinedSensor(combined_coordinator, cfg, device_id)
-            )
+    # Combined sensors read their sources through the same coordinator
+    for cfg in combined_sensors:
+        for address in cfg.address:
+            variables_coordinator.add_address(address, UPDATE_INTERVAL_NORMAL)
+
+    if regular_sensors or combined_sensors:
+        await variables_coordinator.async_refresh_new_addresses()
+        entity_groups.append(
+            HomesideVariableSensor(variables_coordinator, cfg, device_id)
+            for cfg in regular_sensors
+        )
+        entity_groups.append(
+            HomesideCombinedSensor(variables_coordinator, cfg, device_id)
+            for cfg in combined_sensors
+        )
     
     # Add diagnostic sensors (only if show_diagnostic is enabled)
     if show_diagnostic:
         async def _update_diagnostics() -> dict[str, Any]:
-            await client.ensure_connected()
+            # Served over plain HTTP, independent of the WebSocket session
             return await client.get_debug_info()
         
         diagnostic_coordinator = DataUpdateCoordinator(
@@ -239,15 +152,16 @@ async def async_setup_entry(
             name="homeside_diagnostics",
             update_method=_update_diagnostics,
             update_interval=timedelta(seconds=UPDATE_INTERVAL_DIAGNOSTIC),
+            always_update=False,
         )
         
         await diagnostic_coordinator.async_refresh()
-        entities.extend(
+        entity_groups.append(
             HomesideDiagnosticSensor(diagnostic_coordinator, sensor_key, sensor_config, device_id)
             for sensor_key, sensor_config in DIAGNOSTIC_SENSORS.items()
         )
 
-    async_add_entities(entities)
+    async_add_entities(chain.from_iterable(entity_groups))
 
 
 class HomesideIdentitySensor(SensorEntity):
@@ -262,14 +176,10 @@ class HomesideIdentitySensor(SensorEntity):
         self._coordinator = coordinator
         self.entity_description = description
         self._device_id = device_id
-        self._attr_unique_id = f"homeside_{description.key}"
-
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
         }
+        self._attr_unique_id = f"homeside_{description.key}"
 
     @property
     def available(self) -> bool:
@@ -283,19 +193,23 @@ class HomesideIdentitySensor(SensorEntity):
         await self._coordinator.async_request_refresh()
 
 
-class HomesideVariableSensor(SensorEntity):
+class HomesideVariableSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: HomesideDataUpdateCoordinator,
         config: VariableConfig,
         device_id: str,
     ) -> None:
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._config = config
         self._name = config.name
+        self._address = config.address[0]
         self._device_id = device_id
-        self._attr_unique_id = f"homeside_var_{config.key.replace(':', '_').replace('/', '_')}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
+        self._attr_unique_id = f"homeside_var_{uid_slug(config.key)}"
         if config.unit:
             self._attr_native_unit_of_measurement = config.unit
         if config.device_class:
@@ -303,86 +217,61 @@ class HomesideVariableSensor(SensorEntity):
         if config.decimals is not None:
             self._attr_suggested_display_precision = config.decimals
 
-    @property
-    def name(self) -> str | None:
-        return self._name
-
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
         }
 
     @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
+    def name(self) -> str | None:
+        return self._name
 
     @property
     def native_value(self) -> Any:
-        data = self._coordinator.data or {}
-        values = data.get("values", {})
-        errors = data.get("errors", {})
-        value = values.get(self._name)
-        error = errors.get(self._name)
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
-        if error and error.get("code") == 47 and value is None:
-            return none_value_default
+        data = self.coordinator.data or _EMPTY
+        value = data["values"].get(self._address)
+        if value is None:
+            error = data["errors"].get(self._address)
+            if error and error.get("code") == 47:
+                return self._config.none_value
         return value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        data = self._coordinator.data or {}
-        errors = data.get("errors", {})
-        info = errors.get(self._name)
-        note = (data.get("notes", {}) or {}).get(self._name)
-        access = (data.get("access", {}) or {}).get(self._name)
-        role_access = (data.get("role_access", {}) or {}).get(self._name)
-        extra: dict[str, Any] = {}
-        if note:
-            extra["note"] = note
-        if access:
-            extra["access"] = access
-        if role_access:
-            extra["role_access"] = role_access
+        info = (self.coordinator.data or _EMPTY)["errors"].get(self._address)
         if not info:
-            return extra or None
-        extra.update(
-            {
-                "error_code": info.get("code"),
-                "error_text": info.get("text"),
-            }
-        )
-        return extra
-
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
+            return self._static_attrs or None
+        return {
+            **self._static_attrs,
+            "error_code": info.get("code"),
+            "error_text": info.get("text"),
+        }
 
 
-class HomesideCombinedSensor(SensorEntity):
+class HomesideCombinedSensor(CoordinatorEntity, SensorEntity):
     """Sensor that combines multiple variables into one."""
     _attr_has_entity_name = True
 
     def __init__(self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: HomesideDataUpdateCoordinator,
         config: VariableConfig,
         device_id: str,
     ) -> None:
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._config = config
         self._name = config.name
+        self._addresses = tuple(config.address)
         self._device_id = device_id
-        self._attr_unique_id = f"homeside_combined_{config.key.replace(':', '_').replace('/', '_')}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
+        self._attr_unique_id = f"homeside_combined_{uid_slug(config.key)}"
         if config.unit:
             self._attr_native_unit_of_measurement = config.unit
         if config.device_class:
@@ -390,80 +279,74 @@ class HomesideCombinedSensor(SensorEntity):
         if config.decimals is not None:
             self._attr_suggested_display_precision = config.decimals
 
-    @property
-    def name(self) -> str | None:
-        return self._name
-
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("address", config.address),
+                ("format", config.format),
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
         }
 
+        self._value: Any = None
+        self._sources: dict[str, Any] = {}
+        self._errors: dict[str, Any] = {}
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Format the combined value once per coordinator update."""
+        data = self.coordinator.data or {}
+        errors = data.get("errors", {})
+        get = data.get("values", {}).get
+        sources = {addr: get(addr) for addr in self._addresses}
+
+        # Apply format template (only when every source has a value)
+        value = None
+        fmt = self._config.format
+        if fmt and None not in sources.values():
+            try:
+                value = fmt.format(*[sources[addr] for addr in self._addresses])
+            except (KeyError, IndexError, ValueError) as e:
+                _LOGGER.warning("Failed to format combined sensor %s: %s", self._name, e)
+
+        self._value = value
+        self._sources = sources
+        self._errors = {addr: errors[addr] for addr in self._addresses if errors.get(addr)}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
     @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
+    def name(self) -> str | None:
+        return self._name
 
     @property
     def native_value(self) -> Any:
-        data = self._coordinator.data or {}
-        value = data.get("value")
-        errors = data.get("errors", {})
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
+        value = self._value
         # If any error for a source is code 47 and value is None, use fallback
-        if any((err and err.get("code") == 47 and value is None) for err in errors.values()):
-            return none_value_default
+        if value is None and any(err.get("code") == 47 for err in self._errors.values()):
+            return self._config.none_value
         return value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        data = self._coordinator.data or {}
-        sources = data.get("sources", {})
-        errors = data.get("errors", {})
-        
-        extra: dict[str, Any] = {}
-        
-        # Add source variable values
+        sources = self._sources
+        errors = self._errors
+        if not sources and not errors:
+            return self._static_attrs or None
+
+        extra: dict[str, Any] = {**self._static_attrs}
         if sources:
             extra["sources"] = sources
-        
-        # Add address addresses
-        if self._config.address:
-            extra["address"] = self._config.address
-        
-        # Add format template
-        if self._config.format:
-            extra["format"] = self._config.format
-        
-        # Add note if available
-        if self._config.note:
-            extra["note"] = self._config.note
-        
-        # Add access info
-        if self._config.access:
-            extra["access"] = self._config.access
-        if self._config.role_access:
-            extra["role_access"] = self._config.role_access
-        
-        # Add any errors
-        if any(errors.values()):
-            extra["errors"] = {k: v for k, v in errors.items() if v}
-        
-        return extra or None
-
-    async def async_update(self) -> None:
-        await self._coordinator.async_request_refresh()
+        if errors:
+            extra["errors"] = errors
+        return extra
 
 
 class HomesideDiagnosticSensor(SensorEntity):
@@ -482,6 +365,9 @@ class HomesideDiagnosticSensor(SensorEntity):
         self._coordinator = coordinator
         self._sensor_key = sensor_key
         self._device_id = device_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
         self._attr_unique_id = f"homeside_diag_{sensor_key}"
         self._attr_name = sensor_config["name"]
         self._attr_native_unit_of_measurement = sensor_config["unit"]
@@ -489,13 +375,6 @@ class HomesideDiagnosticSensor(SensorEntity):
         self._attr_device_class = sensor_config["device_class"]
         self._attr_state_class = sensor_config["state_class"]
 
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
-
     @property
     def available(self) -> bool:
         return self._coordinator.last_update_success
@@ -507,58 +386,3 @@ class HomesideDiagnosticSensor(SensorEntity):
 
     async def async_update(self) -> None:
         await self._coordinator.async_request_refresh()
-
-
-def _load_variable_configs() -> list[VariableConfig]:
-    if not _VARIABLES_FILE.exists():
-        return []
-
-    try:
-        raw = json.loads(_VARIABLES_FILE.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
-        _LOGGER.warning("Failed to read variables mapping: %s", exc)
-        return []
-
-    default_role_access = raw.get("role_access_default") or "Guest"
-
-    configs: list[VariableConfig] = []
-    for key, info in (raw.get("mapping") or {}).items():
-        if not key or not isinstance(key, str):
-            continue
-        if not isinstance(info, dict):
-            _LOGGER.debug("Skipping %s: config must be an object", key)
-            continue
-        
-        address = info.get("address")
-        if not address or not isinstance(address, list):
-            _LOGGER.debug("Skipping %s: address is required and must be a list", key)
-            continue
-        
-        name = str(info.get("name") or key)
-        enabled = bool(info.get("enabled", False))
-        vtype = str(info.get("type") or "sensor")
-        note = info.get("note")
-        access = info.get("access")
-        role_access = info.get("role_access") or default_role_access
-        unit = info.get("unit")
-        device_class = info.get("device_class")
-        format_template = info.get("format")
-        decimals = info.get("decimals")
-        
-        configs.append(
-            VariableConfig(
-                key=key,
-                name=name,
-                enabled=enabled,
-                type=vtype,
-                note=note,
-                access=access,
-                role_access=role_access,
-                unit=unit,
-                device_class=device_class,
-                address=address,
-                format=format_template,
-                decimals=decimals,
-            )
-        )
-    return configs
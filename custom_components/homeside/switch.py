@@ -1,90 +1,87 @@
 """Support for Homeside switches."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
 import logging
-from pathlib import Path
+import re
 from typing import Any
-from datetime import timedelta
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from ._vars import VariableConfig, async_get_variable_configs, uid_slug
 from .client import HomesideClient
+from .coordinator import HomesideDataUpdateCoordinator
 from .const import DOMAIN, UPDATE_INTERVAL_NORMAL
 
 _LOGGER = logging.getLogger(__name__)
-_VARIABLES_FILE = Path(__file__).resolve().parent / "variables.json"
-
-
-@dataclass(frozen=True, kw_only=True)
-class VariableConfig:
-    key: str  # Descriptive key from variables.json
-    name: str
-    enabled: bool
-    type: str
-    note: str | None = None
-    access: str | None = None
-    role_access: str | None = None
-    address: list[str]  # Address(es) for this entity
-    format: str | None = None
-
-
-def _load_variable_configs() -> list[VariableConfig]:
-    """Load variables from variables.json."""
-    if not _VARIABLES_FILE.exists():
-        return []
-    
-    try:
-        raw = json.loads(_VARIABLES_FILE.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
-        _LOGGER.warning("Failed to read variables mapping: %s", exc)
-        return []
-    
-    default_role_access = raw.get("role_access_default") or "Guest"
-    
-    configs: list[VariableConfig] = []
-    for key, info in (raw.get("mapping") or {}).items():
-        if not key or not isinstance(key, str):
-            continue
-        if not isinstance(info, dict):
-            continue
-        
-        address = info.get("address")
-        if not address or not isinstance(address, list):
-            continue
-        
-        name = str(info.get("name") or key)
-        enabled = bool(info.get("enabled", False))
-        vtype = str(info.get("type") or "sensor")
-        note = info.get("note")
-        access = info.get("access")
-        role_access = info.get("role_access") or default_role_access
-        format_template = info.get("format")
-        
-        configs.append(
-            VariableConfig(
-                key=key,
-                name=name,
-                enabled=enabled,
-                type=vtype,
-                note=note,
-                access=access,
-                role_access=role_access,
-                address=address,
-                format=format_template,
-            )
-        )
-    
-    return configs
+
+# Switch names (lowercased) that mark a configuration switch
+_CONFIG_SWITCH_RE = re.compile("|".join(map(re.escape, ("av/på", "val", "rumsgivare"))))
+
+# Probed and boolean addresses, keyed by controller serial
+_TYPES_STORAGE_VERSION = 1
+_TYPES_STORAGE_KEY = f"{DOMAIN}_types"
+
+# Shared stand-in for coordinator data before the first successful refresh
+_EMPTY: dict[str, dict[str, Any]] = {"values": {}, "errors": {}}
+
+# Lowercased strings a combined value counts as "on"
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "on", "yes"})
+
+
+async def _async_get_bool_addresses(
+    hass: HomeAssistant,
+    client: HomesideClient,
+    addresses: list[str],
+    known_values: dict[str, Any],
+) -> set[str]:
+    """Return the subset of addresses holding booleans.
+
+    Results are persisted per controller serial, so only addresses that were
+    never successfully probed are checked. Values already in known_values
+    (the shared coordinator's data) are used as is; the rest are read from
+    the controller.
+    """
+    store: Store[dict[str, Any]] = Store(hass, _TYPES_STORAGE_VERSION, _TYPES_STORAGE_KEY)
+    serial = client.identity.serial
+    stored = await store.async_load() or {}
+    cached = stored.get(serial, {}) if serial is not None else {}
+    probed: set[str] = set(cached.get("probed", ()))
+    bools: set[str] = set(cached.get("bool", ()))
+
+    unknown = [address for address in addresses if address not in probed]
+    if unknown:
+        values = {
+            address: known_values[address]
+            for address in unknown
+            if known_values.get(address) is not None
+        }
+        missing = [address for address in unknown if address not in values]
+        if missing:
+            # Verify they are actually boolean by reading all values in one request
+            try:
+                read, _errors = await client.read_points_with_errors(missing)
+            except (ConnectionError, TimeoutError) as e:
+                _LOGGER.debug("Error reading switch candidates: %s", e)
+            else:
+                values.update(read)
+        for address in unknown:
+            value = values.get(address)
+            if value is None:
+                continue  # Unreadable right now, probe again next start
+            probed.add(address)
+            if isinstance(value, bool):
+                bools.add(address)
+        if serial is not None:
+            stored[serial] = {"probed": sorted(probed), "bool": sorted(bools)}
+            await store.async_save(stored)
+
+    return bools
 
 
 async def async_setup_entry(
@@ -96,119 +93,85 @@ async def async_setup_entry(
     client: HomesideClient = hass.data[DOMAIN][entry.entry_id]["client"]
     device_id = hass.data[DOMAIN][entry.entry_id]["device_id"]
 
-    variable_configs = _load_variable_configs()
+    variable_configs = await async_get_variable_configs(hass)
     # Session-level filtering
     from .const import ROLE_HIERARCHY
     session_level = getattr(client, '_session_level', None)
     allowed_roles = set()
     if session_level is not None:
         allowed_roles = set(ROLE_HIERARCHY[: session_level + 1])
-    # Get all boolean writable variables that are enabled (type=switch or binary_sensor with write access)
-    switch_configs = [
-        cfg for cfg in variable_configs
-        if cfg.enabled and cfg.access == "read_write" and cfg.type in ["switch", "binary_sensor"]
-        and (not cfg.role_access or cfg.role_access in allowed_roles)
-    ]
-    # Separate combined from regular switches
-    combined_switches = [cfg for cfg in switch_configs if cfg.address]
-    regular_switches = [cfg for cfg in switch_configs if not cfg.address]
+    # Get all boolean writable variables that are enabled (type=switch or
+    # binary_sensor with write access), separating combined from regular
+    # switches in the same pass
+    combined_switches: list[VariableConfig] = []
+    regular_switches: list[VariableConfig] = []
+    for cfg in variable_configs:
+        if not cfg.enabled or cfg.access != "read_write":
+            continue
+        if cfg.type != "switch" and cfg.type != "binary_sensor":
+            continue
+        if cfg.role_access and cfg.role_access not in allowed_roles:
+            continue
+        count = len(cfg.address)
+        if count > 1:
+            combined_switches.append(cfg)
+        elif count == 1:
+            regular_switches.append(cfg)
     if not regular_switches and not combined_switches:
         return
     
+    # Switch states are polled by the entry's shared coordinator
+    coordinator: HomesideDataUpdateCoordinator = (
+        hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    )
     entities = []
     
     # Regular switches
     if regular_switches:
-        # Verify they are actually boolean by reading values
-        verified_switches = []
-        for cfg in regular_switches:
-            try:
-                value = await client.read_point(cfg.address[0])
-                if isinstance(value, bool):
-                    verified_switches.append(cfg)
-            except Exception as e:
-                _LOGGER.debug(f"Error reading {cfg.address[0]}: {e}")
+        bool_addresses = await _async_get_bool_addresses(
+            hass,
+            client,
+            [cfg.address[0] for cfg in regular_switches],
+            (coordinator.data or _EMPTY)["values"],
+        )
+        verified_switches = [
+            cfg for cfg in regular_switches if cfg.address[0] in bool_addresses
+        ]
         
-        if verified_switches:
-            # Create coordinator for switch updates
-            async def _update() -> dict[str, Any]:
-                await client.ensure_connected()
-                data = {}
-                for cfg in verified_switches:
-                    try:
-                        value = await client.read_point(cfg.address[0])
-                        if value is not None:
-                            data[cfg.name] = value
-                    except Exception as e:
-                        _LOGGER.debug(f"Error reading {cfg.address[0]}: {e}")
-                return data
-
-            coordinator = DataUpdateCoordinator(
-                hass,
-                _LOGGER,
-                name="homeside_switches",
-                update_method=_update,
-                update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
-            )
-
-            await coordinator.async_config_entry_first_refresh()
-
-            entities.extend([
-                HomesideSwitch(coordinator, client, device_id, cfg)
-                for cfg in verified_switches
-            ])
+        for cfg in verified_switches:
+            coordinator.add_address(cfg.address[0], UPDATE_INTERVAL_NORMAL)
+        entities.extend(
+            HomesideSwitch(coordinator, client, device_id, cfg)
+            for cfg in verified_switches
+        )
     
-    # Combined switches (read-only)
-    if combined_switches:
-        for cfg in combined_switches:
-            if not cfg.address:
-                continue
-            
-            variables = cfg.address
-            
-            async def _update_combined(vars=variables, fmt=cfg.format, cfg_name=cfg.name) -> dict[str, Any]:
-                await client.ensure_connected()
-                values, errors = await client.read_points_with_errors(vars)
-                
-                # Apply format template
-                if fmt and all(addr in values for addr in vars):
-                    try:
-                        formatted_value = fmt.format(*[values[addr] for addr in vars])
-                    except (KeyError, IndexError, ValueError) as e:
-                        _LOGGER.warning("Failed to format combined switch %s: %s", cfg_name, e)
-                        formatted_value = None
-                else:
-                    formatted_value = None
-                
-                return {
-                    "value": formatted_value,
-                    "sources": {addr: values.get(addr) for addr in vars},
-                    "errors": {addr: errors.get(addr) for addr in vars},
-                }
-            
-            combined_coordinator = DataUpdateCoordinator(
-                hass,
-                logger=_LOGGER,
-                name=f"homeside_combined_switch_{cfg.address[0].replace(':', '_')}",
-                update_method=_update_combined,
-                update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
-            )
-            
-            await combined_coordinator.async_refresh()
-            entities.append(
-                HomesideCombinedSwitch(combined_coordinator, cfg, device_id)
-            )
+    # Combined switches (read-only), one per config
+    for cfg in combined_switches:
+        for address in cfg.address:
+            coordinator.add_address(address, UPDATE_INTERVAL_NORMAL)
+    
+    if not entities and not combined_switches:
+        return
+    
+    await coordinator.async_refresh_new_addresses()
+    
+    entities.extend(
+        HomesideCombinedSwitch(coordinator, cfg, device_id)
+        for cfg in combined_switches
+    )
 
     async_add_entities(entities)
-    _LOGGER.info(f"Added {len(entities)} Homeside switches")
+    _LOGGER.info("Added %d Homeside switches", len(entities))
 
 
 class HomesideSwitch(CoordinatorEntity, SwitchEntity):
     """Representation of a Homeside switch."""
 
+    coordinator: HomesideDataUpdateCoordinator
+
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: HomesideDataUpdateCoordinator,
         client: HomesideClient,
         device_id: str,
         config: VariableConfig,
@@ -217,22 +180,19 @@ class HomesideSwitch(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
         self._client = client
         self._device_id = device_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
         self._config = config
         self._name = config.name
+        self._address = config.address[0]
         self._attr_name = f"Homeside {config.name}"
-        self._attr_unique_id = f"homeside_{config.key.replace(":", "_").replace("/", "_")}"
+        self._attr_unique_id = f"homeside_{uid_slug(config.key)}"
         
         # Set entity category if it's a configuration switch
-        if any(word in config.name.lower() for word in ["av/på", "val", "rumsgivare"]):
+        if _CONFIG_SWITCH_RE.search(config.name_lower):
             self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-        }
-
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         extra = {}
@@ -249,99 +209,111 @@ class HomesideSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
-        value = self.coordinator.data.get(self._name)
-        # Try to get error info if available
-        errors = getattr(self.coordinator, 'data', {}).get('errors', {}) if hasattr(self.coordinator, 'data') else {}
-        error = errors.get(self._name) if errors else None
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
-        if error and error.get("code") == 47 and value is None:
-            value = none_value_default
+        data = self.coordinator.data or _EMPTY
+        value = data["values"].get(self._address)
         if value is None:
-            return None
+            error = data["errors"].get(self._address)
+            if error and error.get("code") == 47:
+                value = self._config.none_value
+            if value is None:
+                return None
         return bool(value)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self._client.write_point(self._config.address[0], True)
-        await self.coordinator.async_request_refresh()
+        await self._client.write_point(self._address, True)
+        await self.coordinator.async_refresh_address(self._address)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self._client.write_point(self._config.address[0], False)
-        await self.coordinator.async_request_refresh()
+        await self._client.write_point(self._address, False)
+        await self.coordinator.async_refresh_address(self._address)
 
 
-class HomesideCombinedSwitch(SwitchEntity):
+class HomesideCombinedSwitch(CoordinatorEntity, SwitchEntity):
     """Read-only switch that combines multiple variables into one."""
     
     _attr_has_entity_name = True
     
+    coordinator: HomesideDataUpdateCoordinator
+
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: HomesideDataUpdateCoordinator,
         config: VariableConfig,
         device_id: str,
     ) -> None:
         """Initialize the combined switch."""
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._config = config
+        self._addresses = tuple(config.address)
         self._device_id = device_id
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_id)},
+        }
         self._name = config.name
-        self._attr_unique_id = f"homeside_combined_{config.key.replace(":", "_").replace("/", "_")}_switch"
+        self._attr_unique_id = f"homeside_combined_{uid_slug(config.key)}_switch"
         self._attr_name = f"Homeside {config.name}"
         
         # Combined switches are read-only
-        self._attr_entity_category = EntityCategory.Switch
-    
-    @property
-    def device_info(self):
-        from .const import DOMAIN
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        # Config-derived attributes never change, build them once
+        self._static_attrs: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("address", config.address),
+                ("format", config.format),
+                ("note", config.note),
+                ("access", config.access),
+                ("role_access", config.role_access),
+            )
+            if value
         }
-    
-    @property
-    def available(self) -> bool:
-        return self._coordinator.last_update_success
+
+        self._is_on: bool | None = None
+        self._sources: dict[str, Any] = {}
+        self._errors: dict[str, Any] = {}
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Format the combined value once per coordinator update."""
+        data = self.coordinator.data or _EMPTY
+        errors = data["errors"]
+        get = data["values"].get
+        sources = {addr: get(addr) for addr in self._addresses}
+
+        # Apply format template (only when every source has a value)
+        value = None
+        fmt = self._config.format
+        if fmt and None not in sources.values():
+            try:
+                value = fmt.format(*[sources[addr] for addr in self._addresses])
+            except (KeyError, IndexError, ValueError) as e:
+                _LOGGER.warning("Failed to format combined switch %s: %s", self._config.name, e)
+
+        self._sources = sources
+        self._errors = {addr: errors[addr] for addr in self._addresses if errors.get(addr)}
+
+        # If any error for a source is code 47 and value is None, use fallback
+        if value is None and any(err.get("code") == 47 for err in self._errors.values()):
+            value = self._config.none_value
+        if value is None or value is True or value is False:
+            self._is_on = value
+        elif isinstance(value, str):
+            self._is_on = value.lower() in _TRUTHY
+        else:
+            self._is_on = bool(value)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
     
     @property
     def is_on(self) -> bool | None:
         """Return true if switch is on."""
-        data = self._coordinator.data or {}
-        value = data.get("value")
-        errors = data.get("errors", {})
-        # Load none_value_default from variables.json root
-        none_value_default = 0
-        try:
-            import json
-            from pathlib import Path
-            variables_file = Path(__file__).resolve().parent / "variables.json"
-            with open(variables_file, "r", encoding="utf-8") as f:
-                root = json.load(f)
-                none_value_default = root.get("none_value_dafault", 0)
-        except Exception:
-            pass
-        # If any error for a source is code 47 and value is None, use fallback
-        if any((err and err.get("code") == 47 and value is None) for err in errors.values()):
-            value = none_value_default
-        if value is None:
-            return None
-        if isinstance(value, bool):
-            return value
-        # Try to convert to bool
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'on', 'yes')
-        return bool(value)
+        return self._is_on
     
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Combined switches are read-only."""
@@ -356,34 +328,14 @@ class HomesideCombinedSwitch(SwitchEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra attributes."""
-        data = self._coordinator.data or {}
-        sources = data.get("sources", {})
-        errors = data.get("errors", {})
-        
-        extra: dict[str, Any] = {}
-        
+        sources = self._sources
+        errors = self._errors
+        if not sources and not errors:
+            return self._static_attrs or None
+
+        extra: dict[str, Any] = {**self._static_attrs}
         if sources:
             extra["sources"] = sources
-        
-        if self._config.address:
-            extra["address"] = self._config.address
-        
-        if self._config.format:
-            extra["format"] = self._config.format
-        
-        if self._config.note:
-            extra["note"] = self._config.note
-        
-        if self._config.access:
-            extra["access"] = self._config.access
-        if self._config.role_access:
-            extra["role_access"] = self._config.role_access
-        
-        if any(errors.values()):
-            extra["errors"] = {k: v for k, v in errors.items() if v}
-        
-        return extra or None
-    
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self._coordinator.async_request_refresh()
+        if errors:
+            extra["errors"] = errors
+        return extra